@@ -529,6 +529,10 @@ class TaskClientRunner:
         if self.sio.connected:
             self.sio.disconnect()
 
+        # Release task executor HTTP connections
+        if self.task_adapter:
+            self.task_adapter.close()
+
         logger.info("Client runtime stopped")
 
     def get_current_status(self):
@@ -2,53 +2,126 @@
 Windows Service implementation for Task Management Client
 """
 import os
+import codecs
 import sys
 import time
 import json
+import atexit
 import logging
+import logging.handlers
 import tempfile
 import platform
-import socket
+import threading
+import functools
 from pathlib import Path
 
+# Prefer orjson for config (de)serialization when installed; stdlib json otherwise.
+# _dumps always returns UTF-8 encoded bytes.
+try:
+    import orjson
+    _loads = orjson.loads
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+_MODULE_LOGGER = logging.getLogger(__name__)
+
+# Set once fix_service_path has inserted the sys.path entries
+_PATH_FIXED = False
+_CACHED_PROJECT_ROOT = None
+
 # Fix Python path for Windows service
 def fix_service_path():
     """Fix Python path for Windows service execution.
 
+    The sys.path entries are only computed and inserted on the first call;
+    later calls just restore the working directory if it has changed.
+
     Returns:
         str: The project root directory path
     """
-    # Get the directory where this service.py file is located
-    # service.py lives at <repo_root>/client/service/service.py
-    # so we need to go up two levels to reach <repo_root>
-    service_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(service_dir))
+    global _PATH_FIXED, _CACHED_PROJECT_ROOT
 
-    # Add project root to Python path if not already present
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
+    if not _PATH_FIXED:
+        # Get the directory where this service.py file is located
+        # service.py lives at <repo_root>/client/service/service.py
+        # so we need to go up two levels to reach <repo_root>
+        service_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.dirname(os.path.dirname(service_dir))
 
-    # Also add service directory for relative imports
-    if service_dir not in sys.path:
-        sys.path.insert(0, service_dir)
+        path_set = set(sys.path)
+
+        # Add project root to Python path if not already present
+        if project_root not in path_set:
+            sys.path.insert(0, project_root)
+
+        # Also add service directory for relative imports
+        if service_dir not in path_set:
+            sys.path.insert(0, service_dir)
+
+        _CACHED_PROJECT_ROOT = project_root
+        _PATH_FIXED = True
 
     # Change working directory to project root for consistent file operations
     try:
-        os.chdir(project_root)
+        if os.getcwd() != _CACHED_PROJECT_ROOT:
+            os.chdir(_CACHED_PROJECT_ROOT)
     except Exception:
         pass  # If we can't change directory, continue anyway
 
-    return project_root
+    return _CACHED_PROJECT_ROOT
 
 # Fix path immediately
 project_root = fix_service_path()
 
+# Runner directories live next to this script and never move during the process lifetime
+_SERVICE_DIR = os.path.dirname(os.path.abspath(__file__))
+_LOG_DIR = os.path.join(_SERVICE_DIR, 'logs')
+_WORK_DIR = os.path.join(_SERVICE_DIR, 'work')
+
+# Service log directory; created on the first SvcDoRun of the process only
+_SERVICE_LOG_DIR = "C:/WebGraphicsTask/logs"
+_SERVICE_LOG_DIR_READY = False
+
+# Buffer in front of service.log, set up once per process; the main loop
+# writes it out at least every _SERVICE_LOG_FLUSH_INTERVAL seconds
+_SERVICE_LOG_BUFFER = None
+_SERVICE_LOG_FLUSH_INTERVAL = 5
+
+# Upper bound on client teardown during service stop (SCM allows ~20s)
+_CLIENT_STOP_TIMEOUT = 15
+
+# Config file locations searched by _load_config, in priority order
+_SERVICE_CONFIG_FILE = "C:/WebGraphicsTask/config.json"
+_CFG_CANDIDATES = (
+    _SERVICE_CONFIG_FILE,
+    os.path.join(project_root, "client_config.json"),
+    os.path.join(tempfile.gettempdir(), "web_graphics_tasks_config.json")
+)
+
+# Shared client/server settings (server host and port)
+_COMMON_CFG_FILE = os.path.join(project_root, 'common', 'common.cfg')
+
 # Only import Windows-specific modules on Windows
 if platform.system() == 'Windows':
     import win32serviceutil
     import win32service
     import win32event
     import servicemanager
+
+    # Service state code -> display name, built once for status_service
+    _STATUS_NAMES = {
+        win32service.SERVICE_STOPPED: "STOPPED",
+        win32service.SERVICE_START_PENDING: "START_PENDING",
+        win32service.SERVICE_STOP_PENDING: "STOP_PENDING",
+        win32service.SERVICE_RUNNING: "RUNNING",
+        win32service.SERVICE_CONTINUE_PENDING: "CONTINUE_PENDING",
+        win32service.SERVICE_PAUSE_PENDING: "PAUSE_PENDING",
+        win32service.SERVICE_PAUSED: "PAUSED"
+    }
 else:
     # Mock classes for non-Windows systems - this should not be used on Windows
     print("Warning: Running on non-Windows system, service functionality disabled")
@@ -58,32 +131,196 @@ else:
     win32service = MockServiceFramework()
     win32event = MockServiceFramework()
     servicemanager = MockServiceFramework()
+    _STATUS_NAMES = {}
 
-# Import project modules after path fix
-try:
-    from common.system_info import get_system_info, get_system_summary
-    from common.config import ClientConfig
-    from common.utils import setup_logging
-except ImportError as e:
-    # If imports fail, we'll handle it later in the service
-    print(f"Warning: Failed to import common modules: {e}")
+# Cached outcome of check_windows_service_support (invariant per process)
+_WIN_SVC_OK = None
+_WIN_SVC_ERR = None
 
 def check_windows_service_support():
-    """Check if Windows service support is available"""
-    if platform.system() != 'Windows':
-        raise RuntimeError("Windows services are only supported on Windows")
+    """Check if Windows service support is available.
 
-    try:
-        # Test if we can access the required modules
-        win32serviceutil.InstallService
-        win32service.SERVICE_RUNNING
-        win32event.CreateEvent
-        servicemanager.LogMsg
+    The result is computed once; later calls return it (or re-raise the
+    same error) without probing the modules again.
+    """
+    global _WIN_SVC_OK, _WIN_SVC_ERR
+    if _WIN_SVC_OK is True:
         return True
-    except AttributeError as e:
-        raise RuntimeError(f"Windows service modules not properly loaded: {e}")
-    except Exception as e:
-        raise RuntimeError(f"Windows service support check failed: {e}")
+    if _WIN_SVC_OK is False:
+        raise RuntimeError(_WIN_SVC_ERR)
+
+    try:
+        if platform.system() != 'Windows':
+            raise RuntimeError("Windows services are only supported on Windows")
+
+        try:
+            # Test if we can access the required modules
+            win32serviceutil.InstallService
+            win32service.SERVICE_RUNNING
+            win32event.CreateEvent
+            servicemanager.LogMsg
+        except AttributeError as e:
+            raise RuntimeError(f"Windows service modules not properly loaded: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Windows service support check failed: {e}")
+    except RuntimeError as e:
+        _WIN_SVC_OK = False
+        _WIN_SVC_ERR = str(e)
+        raise
+
+    _WIN_SVC_OK = True
+    return True
+
+def _decode_config_bytes(data):
+    """Decode a config file's bytes with a single BOM sniff instead of trial decoding.
+
+    UTF-16 and UTF-8 BOMs are honoured; unmarked data is read as UTF-8,
+    falling back to cp1252 for files saved by legacy editors.
+    """
+    if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return data.decode('utf-16')
+    if data.startswith(codecs.BOM_UTF8):
+        return data[len(codecs.BOM_UTF8):].decode('utf-8')
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.decode('cp1252')
+
+@functools.lru_cache(maxsize=4)
+def _parse_common_cfg(path_str, mtime_ns):
+    """Parse the SERVER host/port pair from common.cfg.
+
+    Results are cached per (path, mtime) so repeated lookups during a
+    service lifetime skip the file read and parse entirely.
+
+    Returns:
+        tuple: (host, port) strings
+    """
+    import configparser
+
+    with open(path_str, 'rb') as f:
+        text = _decode_config_bytes(f.read())
+
+    config = configparser.ConfigParser()
+    config.read_string(text, source=path_str)
+    return (config.get('SERVER', 'host', fallback='127.0.0.1'),
+            config.get('SERVER', 'port', fallback='5000'))
+
+def _read_common_cfg_server_url():
+    """Return (server_url, cfg_path) from common.cfg; server_url is None if the file is missing"""
+    try:
+        mtime_ns = os.stat(_COMMON_CFG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None, _COMMON_CFG_FILE
+
+    host, port = _parse_common_cfg(_COMMON_CFG_FILE, mtime_ns)
+    return f"http://{host}:{port}", _COMMON_CFG_FILE
+
+# Read-only binary open with the Windows sequential-scan hint (flags are 0 elsewhere)
+_SEQUENTIAL_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_SEQUENTIAL', 0) | getattr(os, 'O_BINARY', 0)
+
+# Parsed JSON config files: path -> (st_mtime_ns, st_size, data)
+_CONFIG_CACHE = {}
+
+def _cached_json(path):
+    """Load a JSON file, reusing the parsed result while its mtime and size are unchanged.
+
+    Returns:
+        dict: A shallow copy of the parsed data, or None if the file does not exist
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return dict(cached[2])
+
+    try:
+        with os.fdopen(os.open(path, _SEQUENTIAL_READ_FLAGS), 'rb') as f:
+            # Key the cache on the handle we actually read, not the earlier stat
+            st = os.fstat(f.fileno())
+            data = _loads(_decode_config_bytes(f.read()))
+    except FileNotFoundError:
+        return None
+    _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return dict(data)
+
+# Shared keep-alive HTTP session, created on first use
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+def get_http_session():
+    """Return the shared requests.Session used for service HTTP calls.
+
+    The session pools keep-alive connections so repeated calls to the
+    server skip the TCP (and TLS) handshake.
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(total=2, backoff_factor=0.2)
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+# TaskClientRunner class, resolved once per process by _load_task_client_runner_cls
+_TASK_CLIENT_RUNNER_CLS = None
+_TASK_CLIENT_RUNNER_LOCK = threading.Lock()
+
+def _load_task_client_runner_cls(log=print):
+    """Import TaskClientRunner, caching the class for later calls.
+
+    Falls back to loading client/client_runner.py by file path when the
+    package import fails (e.g. the service started with an unexpected
+    sys.path). The fallback compiles a fresh module, so it must only run once.
+
+    Args:
+        log: Callable used for progress messages
+
+    Raises:
+        ImportError: If neither import method finds the runner
+    """
+    global _TASK_CLIENT_RUNNER_CLS
+    if _TASK_CLIENT_RUNNER_CLS is not None:
+        return _TASK_CLIENT_RUNNER_CLS
+
+    # The SvcDoRun preload thread and the start path may both get here first
+    with _TASK_CLIENT_RUNNER_LOCK:
+        if _TASK_CLIENT_RUNNER_CLS is not None:
+            return _TASK_CLIENT_RUNNER_CLS
+
+        try:
+            from client.client_runner import TaskClientRunner
+            log("TaskClientRunner imported successfully")
+        except ImportError as e:
+            log(f"Failed to import TaskClientRunner: {e}")
+            runner_path = os.path.join(project_root, 'client', 'client_runner.py')
+            if not os.path.exists(runner_path):
+                raise ImportError(f"Runner file not found: {runner_path}") from e
+
+            log("Attempting alternative import...")
+            import importlib.util
+            spec = importlib.util.spec_from_file_location("client.client_runner", runner_path)
+            runner_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(runner_module)
+            TaskClientRunner = runner_module.TaskClientRunner
+            log("TaskClientRunner imported via alternative method")
+
+        _TASK_CLIENT_RUNNER_CLS = TaskClientRunner
+        return TaskClientRunner
 
 def generate_client_name():
     """Generate client name using hostname only"""
@@ -103,46 +340,96 @@ class TaskClientService(win32serviceutil.ServiceFramework):
 
     def __init__(self, args):
         win32serviceutil.ServiceFramework.__init__(self, args)
-        self.hWaitStop = win32event.CreateEvent(None, 0, 0, None)
+        # Manual-reset: the main loop and the client start thread both wait on it
+        self.hWaitStop = win32event.CreateEvent(None, 1, 0, None)
         self.client = None
         self.config_file = None
-        self.logger = None
+        self.logger = _MODULE_LOGGER
+        self.log_buffer = None
 
     def SvcStop(self):
-        """Stop the service"""
+        """Stop the service.
+
+        Only signals the main thread; client teardown (including the
+        unregister HTTP call) runs in SvcDoRun so the SCM dispatcher
+        thread is never blocked on the network.
+        """
         self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING)
 
         if self.logger:
             self.logger.info("Service stop requested")
+        if self.log_buffer:
+            self.log_buffer.flush()
+
+        win32event.SetEvent(self.hWaitStop)
 
-        # Unregister from server
+    def _shutdown_client(self):
+        """Unregister from server and stop the client after a stop request.
+
+        The network teardown runs on a worker thread and is waited on for at
+        most _CLIENT_STOP_TIMEOUT seconds so a slow server cannot push the
+        service past the SCM stop budget.
+        """
         if self.client:
-            try:
-                self.client._unregister_client()
-                self.client.stop()
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"Error stopping client: {e}")
+            stop_thread = threading.Thread(target=self._stop_client, daemon=True)
+            stop_thread.start()
+            stop_thread.join(timeout=_CLIENT_STOP_TIMEOUT)
+            if stop_thread.is_alive() and self.logger:
+                self.logger.warning(
+                    "Client shutdown still running after %ss, stopping service anyway",
+                    _CLIENT_STOP_TIMEOUT
+                )
 
-        win32event.SetEvent(self.hWaitStop)
+        # Event Log write is a synchronous RPC; done here rather than in SvcStop
+        try:
+            servicemanager.LogMsg(servicemanager.EVENTLOG_INFORMATION_TYPE,
+                                servicemanager.PYS_SERVICE_STOPPED,
+                                (self._svc_name_, ''))
+        except Exception as e:
+            if self.logger:
+                self.logger.warning("Failed to log to event manager: %s", e)
 
         if self.logger:
             self.logger.info("Service stopped")
+        if self.log_buffer:
+            self.log_buffer.flush()
+
+    def _stop_client(self):
+        """Stop the client runtime; stop() already unregisters from the server"""
+        try:
+            if getattr(self.client, 'running', False):
+                self.client.stop()
+            else:
+                # Runtime never came up, so stop() would be a no-op: unregister directly
+                self.client._unregister_client()
+        except Exception as e:
+            if self.logger:
+                self.logger.error("Error stopping client: %s", e)
 
     def SvcDoRun(self):
         """Run the service"""
+        init_started = time.perf_counter()
         try:
             # Initialize logging for service
             self._setup_service_logging()
 
-            if not self.logger:
-                # Fallback logging if setup failed
-                import logging
-                logging.basicConfig(level=logging.INFO)
-                self.logger = logging.getLogger(__name__)
-
             self.logger.info("Service starting...")
 
+            # Import TaskClientRunner in the background while the config loads;
+            # the import is the slowest start step and does not need the config
+            runner_holder = {}
+            runner_ready = threading.Event()
+
+            def _preload_runner():
+                try:
+                    runner_holder['cls'] = _load_task_client_runner_cls(self.logger.info)
+                except Exception as e:
+                    self.logger.error("Background TaskClientRunner import failed: %s", e)
+                finally:
+                    runner_ready.set()
+
+            threading.Thread(target=_preload_runner, daemon=True).start()
+
             # Load configuration
             config = self._load_config()
             if not config:
@@ -159,41 +446,26 @@ class TaskClientService(win32serviceutil.ServiceFramework):
                                     servicemanager.PYS_SERVICE_STARTED,
                                     (self._svc_name_, ''))
             except Exception as e:
-                self.logger.warning(f"Failed to log to event manager: {e}")
+                self.logger.warning("Failed to log to event manager: %s", e)
 
-            self.logger.info(f"Starting Web Graphics Task")
-            self.logger.info(f"Server URL: {config.get('server_url')}")
-            self.logger.info(f"client Name: {config.get('client_name')}")
+            self.logger.info("Starting Web Graphics Task")
+            self.logger.info("Server URL: %s", config.get('server_url'))
+            self.logger.info("client Name: %s", config.get('client_name'))
 
-            # Wait a moment for system to stabilize
-            import time
-            time.sleep(2)
+            # Wait a moment for system to stabilize (a stop request ends the wait early)
+            self._wait_for_stop(2)
 
             # Create and start client with error handling
             try:
                 self.logger.info("Fixing Python path for service execution...")
                 # Re-fix path in case service changed working directory
                 repo_root = fix_service_path()
-                self.logger.info(f"Repository root: {repo_root}")
+                self.logger.info("Repository root: %s", repo_root)
 
                 self.logger.info("Importing TaskClient...")
                 # Import TaskClient dynamically to avoid import issues at module level
-                try:
-                    # Use new modular client architecture
-                    from client.client_runner import TaskClientRunner
-                    from client.config_manager import get_config_manager
-                    self.logger.info("TaskClientRunner imported successfully")
-                except ImportError as e:
-                    self.logger.error(f"Failed to import TaskClientRunner: {e}")
-                    self.logger.info("Attempting alternative import...")
-                    # Try absolute import
-                    import importlib.util
-                    runner_path = os.path.join(repo_root, 'client', 'client_runner.py')
-                    spec = importlib.util.spec_from_file_location("client.client_runner", runner_path)
-                    runner_module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(runner_module)
-                    TaskClientRunner = runner_module.TaskClientRunner
-                    self.logger.info("TaskClientRunner imported via alternative method")
+                runner_ready.wait(timeout=20)
+                TaskClientRunner = runner_holder.get('cls') or _load_task_client_runner_cls(self.logger.info)
 
                 self.logger.info("Creating TaskClientRunner instance...")
 
@@ -206,15 +478,14 @@ class TaskClientService(win32serviceutil.ServiceFramework):
                     'heartbeat_interval': config.get('heartbeat_interval', 30),
                     'config_update_interval': config.get('config_update_interval', 600),
                     'log_level': config.get('log_level', 'INFO'),
-                    'log_dir': os.path.join(os.path.dirname(__file__), 'logs'),
-                    'work_dir': os.path.join(os.path.dirname(__file__), 'work')
+                    'log_dir': _LOG_DIR,
+                    'work_dir': _WORK_DIR
                 }
 
                 self.client = TaskClientRunner(runner_config)
                 self.logger.info("TaskClientRunner instance created successfully")
 
                 # Start client in separate thread with delay
-                import threading
                 client_thread = threading.Thread(target=self._delayed_client_start)
                 client_thread.daemon = True
                 client_thread.start()
@@ -222,21 +493,24 @@ class TaskClientService(win32serviceutil.ServiceFramework):
                 self.logger.info("Client thread started successfully")
 
             except Exception as e:
-                self.logger.error(f"Failed to create/start client: {e}")
-                import traceback
-                self.logger.error(traceback.format_exc())
+                self.logger.exception("Failed to create/start client: %s", e)
                 # Don't exit immediately, keep service running for monitoring
 
-            # Wait for stop signal
+            # Wait for stop signal, writing buffered log records out meanwhile
+            self.logger.info("Service initialization took %.3fs", time.perf_counter() - init_started)
             self.logger.info("Service main loop started, waiting for stop signal")
-            win32event.WaitForSingleObject(self.hWaitStop, win32event.INFINITE)
+            while win32event.WaitForMultipleObjects(
+                    [self.hWaitStop], 0, _SERVICE_LOG_FLUSH_INTERVAL * 1000) == win32event.WAIT_TIMEOUT:
+                if self.log_buffer:
+                    self.log_buffer.flush()
+
+            # Stop requested: tear the client down here, off the SCM thread
+            self._shutdown_client()
 
         except Exception as e:
             error_msg = f"Service critical error: {e}"
             if self.logger:
-                self.logger.error(error_msg)
-                import traceback
-                self.logger.error(traceback.format_exc())
+                self.logger.exception(error_msg)
             try:
                 servicemanager.LogErrorMsg(error_msg)
             except:
@@ -249,21 +523,19 @@ class TaskClientService(win32serviceutil.ServiceFramework):
         Retries indefinitely with backoff until the client runtime is running.
         """
         try:
-            import time
-            time.sleep(5)  # Wait 5 seconds before starting client
-
-            if not self.client:
+            # Wait 5 seconds before starting client, unless a stop arrives first
+            if self._wait_for_stop(5) or not self.client:
                 return
 
             retry_delays = [30, 60, 120, 300]  # seconds between retries
             attempt = 0
 
             while True:
-                self.logger.info(f"Starting TaskClient (attempt {attempt + 1})...")
+                self.logger.info("Starting TaskClient (attempt %s)...", attempt + 1)
                 try:
                     self.client.start()
                 except Exception as e:
-                    self.logger.error(f"TaskClient start() raised unexpectedly: {e}")
+                    self.logger.error("TaskClient start() raised unexpectedly: %s", e)
 
                 if getattr(self.client, 'running', False):
                     self.logger.info("TaskClient started successfully")
@@ -271,20 +543,29 @@ class TaskClientService(win32serviceutil.ServiceFramework):
 
                 delay = retry_delays[min(attempt, len(retry_delays) - 1)]
                 self.logger.error(
-                    f"TaskClient failed to start (registration/connection error). "
-                    f"Retrying in {delay} seconds..."
+                    "TaskClient failed to start (registration/connection error). "
+                    "Retrying in %s seconds...",
+                    delay
                 )
                 attempt += 1
-                time.sleep(delay)
+                if self._wait_for_stop(delay):
+                    return
 
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Delayed client start error: {e}")
-                import traceback
-                self.logger.error(traceback.format_exc())
+                self.logger.exception("Delayed client start error: %s", e)
             else:
                 print(f"Delayed client start error: {e}")
 
+    def _wait_for_stop(self, seconds):
+        """Wait up to `seconds` for the stop event.
+
+        Returns:
+            bool: True if a stop was requested during the wait
+        """
+        rc = win32event.WaitForSingleObject(self.hWaitStop, int(seconds * 1000))
+        return rc == win32event.WAIT_OBJECT_0
+
     def _safe_client_start(self):
         """Safely start the client with error handling (deprecated, use _delayed_client_start)"""
         try:
@@ -292,35 +573,50 @@ class TaskClientService(win32serviceutil.ServiceFramework):
                 self.client.start()
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Client start error: {e}")
+                self.logger.error("Client start error: %s", e)
             else:
                 print(f"Client start error: {e}")
 
     def _setup_service_logging(self):
         """Setup logging for Windows service"""
         try:
-            # Create logs directory
-            log_dir = Path("C:/WebGraphicsTask/logs")
-            log_dir.mkdir(parents=True, exist_ok=True)
-
-            # Setup logging
-            log_file = log_dir / "service.log"
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler(log_file),
-                    logging.StreamHandler()
-                ]
-            )
+            # Create logs directory (once per process)
+            global _SERVICE_LOG_DIR_READY, _SERVICE_LOG_BUFFER
+            if not _SERVICE_LOG_DIR_READY:
+                os.makedirs(_SERVICE_LOG_DIR, exist_ok=True)
+                _SERVICE_LOG_DIR_READY = True
+
+            # Setup logging (once per process; later runs reuse the handlers)
+            # Rotating file behind a memory buffer: routine INFO records are
+            # written in batches, WARNING and above flush immediately
+            if _SERVICE_LOG_BUFFER is None:
+                log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                log_file = os.path.join(_SERVICE_LOG_DIR, "service.log")
+                file_handler = logging.handlers.RotatingFileHandler(
+                    log_file, maxBytes=10_000_000, backupCount=5, encoding='utf-8', delay=True
+                )
+                # The buffer forwards records as-is, so the target needs the formatter
+                file_handler.setFormatter(logging.Formatter(log_format))
+                _SERVICE_LOG_BUFFER = logging.handlers.MemoryHandler(
+                    256, flushLevel=logging.WARNING, target=file_handler, flushOnClose=True
+                )
+                atexit.register(_SERVICE_LOG_BUFFER.flush)
+                logging.basicConfig(
+                    level=logging.INFO,
+                    format=log_format,
+                    handlers=[
+                        _SERVICE_LOG_BUFFER,
+                        logging.StreamHandler()
+                    ]
+                )
+            self.log_buffer = _SERVICE_LOG_BUFFER
 
-            self.logger = logging.getLogger(__name__)
             self.logger.info("Service logging initialized")
 
         except Exception as e:
             # Fallback to basic logging
-            self.logger = logging.getLogger(__name__)
-            self.logger.error(f"Failed to setup service logging: {e}")
+            logging.basicConfig(level=logging.INFO)
+            self.logger.error("Failed to setup service logging: %s", e)
 
     def _load_config(self):
         """Load service configuration"""
@@ -329,19 +625,16 @@ class TaskClientService(win32serviceutil.ServiceFramework):
             server_url = self._read_server_ip()
 
             # Try multiple config file locations
-            config_files = [
-                "C:/WebGraphicsTask/config.json",
-                Path(project_root) / "client_config.json",
-                Path(tempfile.gettempdir()) / "web_graphics_tasks_config.json"
-            ]
-
             config = None
-            for config_file in config_files:
-                if Path(config_file).exists():
-                    with open(config_file, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                        self.logger.info(f"Loaded config from: {config_file}")
-                        break
+            for config_file in _CFG_CANDIDATES:
+                try:
+                    config = _cached_json(config_file)
+                except OSError as e:
+                    self.logger.warning("Skipping config file %s: %s", config_file, e)
+                    continue
+                if config is not None:
+                    self.logger.info("Loaded config from: %s", config_file)
+                    break
 
             # If no config file found, create default configuration
             if not config:
@@ -355,7 +648,7 @@ class TaskClientService(win32serviceutil.ServiceFramework):
             # Override server_url with value from common.cfg if available
             if server_url:
                 config['server_url'] = server_url
-                self.logger.info(f"Using server URL from common.cfg: {server_url}")
+                self.logger.info("Using server URL from common.cfg: %s", server_url)
             elif 'server_url' not in config:
                 config['server_url'] = 'http://localhost:5000'
                 self.logger.warning("Using default server URL: http://localhost:5000")
@@ -363,33 +656,20 @@ class TaskClientService(win32serviceutil.ServiceFramework):
             return config
 
         except Exception as e:
-            self.logger.error(f"Failed to load config: {e}")
+            self.logger.error("Failed to load config: %s", e)
             return None
 
     def _read_server_ip(self):
         """Read server address from common.cfg file"""
         try:
-            import configparser
-
-            # Try common.cfg first
-            common_cfg_file = Path(project_root) / "common" / "common.cfg"
-
-            if common_cfg_file.exists():
-                config = configparser.ConfigParser()
-                config.read(common_cfg_file, encoding='utf-8')
-
-                # Get host and port from common.cfg
-                host = config.get('SERVER', 'host', fallback='127.0.0.1')
-                port = config.get('SERVER', 'port', fallback='5000')
-
-                server_url = f"http://{host}:{port}"
-                self.logger.info(f"Read server address from {common_cfg_file}: {server_url}")
+            server_url, common_cfg_file = _read_common_cfg_server_url()
+            if server_url:
+                self.logger.info("Read server address from %s: %s", common_cfg_file, server_url)
                 return server_url
-            else:
-                self.logger.info(f"common.cfg file not found at {common_cfg_file}")
+            self.logger.info("common.cfg file not found at %s", common_cfg_file)
 
         except Exception as e:
-            self.logger.error(f"Failed to read server address from common.cfg: {e}")
+            self.logger.error("Failed to read server address from common.cfg: %s", e)
 
         return None
 
@@ -399,26 +679,48 @@ class TaskClientService(win32serviceutil.ServiceFramework):
             return
 
         try:
-            import requests
-
             data = {
                 'name': self.client.client_name,
                 'status': 'offline'
             }
 
-            response = requests.post(
+            response = get_http_session().post(
                 f"{self.client.server_url}/api/clients/unregister",
                 json=data,
-                timeout=10
+                timeout=(2, 8)
             )
 
             if response.status_code == 200:
-                self.logger.info(f"client unregistered successfully: {self.client.client_name}")
+                self.logger.info("client unregistered successfully: %s", self.client.client_name)
             else:
-                self.logger.warning(f"Failed to unregister client: {response.status_code}")
+                self.logger.warning("Failed to unregister client: %s", response.status_code)
 
         except Exception as e:
-            self.logger.error(f"Error unregistering client: {e}")
+            self.logger.error("Error unregistering client: %s", e)
+
+# Service installation arguments; none of these depend on runtime state.
+# The class is referenced by its dotted path, not the class object itself.
+_PY_CLASS_STRING = f"{TaskClientService.__module__}.{TaskClientService.__name__}"
+_SERVICE_SCRIPT = os.path.abspath(__file__)
+_EXE_ARGS = f'"{_SERVICE_SCRIPT}"'
+
+def _write_config_atomic(config_file, config):
+    """Write config as JSON via a temp file and os.replace so readers never see a torn file"""
+    buf = _dumps(config)
+    fd, tmp = tempfile.mkstemp(dir=str(Path(config_file).parent), suffix='.tmp')
+    try:
+        try:
+            os.write(fd, buf)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, str(config_file))
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 def install_service(server_url=None, client_name=None):
     """Install the Windows service"""
@@ -443,38 +745,28 @@ def install_service(server_url=None, client_name=None):
         }
 
         config_file = config_dir / "config.json"
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        _write_config_atomic(config_file, config)
 
         print(f"✓ Configuration saved to: {config_file}")
         print(f"  Server URL: {config['server_url']}")
         print(f"  client Name: {config['client_name']}")
         print(f"  Heartbeat Interval: {config['heartbeat_interval']} seconds (10 minutes)")
 
-        # Install service with explicit string encoding
-        service_name = str(TaskClientService._svc_name_)
-        display_name = str(TaskClientService._svc_display_name_)
-        description = str(TaskClientService._svc_description_)
-
-        # Get absolute paths for service installation
-        service_script = os.path.abspath(__file__)
-        project_root = os.path.dirname(os.path.dirname(service_script))
+        service_name = TaskClientService._svc_name_
+        display_name = TaskClientService._svc_display_name_
 
-        print(f"  Service script: {service_script}")
+        print(f"  Service script: {_SERVICE_SCRIPT}")
         print(f"  Project root: {project_root}")
 
         # Install service with proper paths
-        # Use string path to the class, not the class object itself
-        python_class_string = f"{TaskClientService.__module__}.{TaskClientService.__name__}"
-
         win32serviceutil.InstallService(
-            python_class_string,  # Use string path to class
+            _PY_CLASS_STRING,  # Use string path to class
             service_name,
             display_name,
-            description=description,
+            description=TaskClientService._svc_description_,
             startType=win32service.SERVICE_AUTO_START,
             exeName=sys.executable,  # Python executable
-            exeArgs=f'"{service_script}"'  # Service script path
+            exeArgs=_EXE_ARGS  # Service script path
         )
 
         print(f"✓ Service '{display_name}' installed successfully")
@@ -485,33 +777,18 @@ def install_service(server_url=None, client_name=None):
 
     except Exception as e:
         print(f"❌ Failed to install service: {e}")
-        import traceback
-        traceback.print_exc()
+        _MODULE_LOGGER.exception("Service installation failed")
         return False
 
 def _read_server_ip_for_install():
     """Read server address from common.cfg file during installation"""
     try:
-        import configparser
-
-        # Get project root directory
-        current_dir = Path(__file__).parent.parent
-        common_cfg_file = current_dir / "common" / "common.cfg"
-
-        if common_cfg_file.exists():
-            config = configparser.ConfigParser()
-            config.read(common_cfg_file, encoding='utf-8')
-
-            # Get host and port from common.cfg
-            host = config.get('SERVER', 'host', fallback='127.0.0.1')
-            port = config.get('SERVER', 'port', fallback='5000')
-
-            server_url = f"http://{host}:{port}"
+        server_url, common_cfg_file = _read_common_cfg_server_url()
+        if server_url:
             print(f"✓ Read server address from {common_cfg_file}: {server_url}")
             return server_url
-        else:
-            print(f"ℹ️  common.cfg file not found at {common_cfg_file}")
-            print(f"   Using default server configuration")
+        print(f"ℹ️  common.cfg file not found at {common_cfg_file}")
+        print(f"   Using default server configuration")
 
     except Exception as e:
         print(f"⚠️  Failed to read server address from common.cfg: {e}")
@@ -522,7 +799,7 @@ def uninstall_service():
     """Uninstall the Windows service"""
     try:
         # Stop service if running
-        service_name = str(TaskClientService._svc_name_)
+        service_name = TaskClientService._svc_name_
         try:
             win32serviceutil.StopService(service_name)
             print("✓ Service stopped")
@@ -546,14 +823,13 @@ def uninstall_service():
 
     except Exception as e:
         print(f"❌ Failed to uninstall service: {e}")
-        import traceback
-        traceback.print_exc()
+        _MODULE_LOGGER.exception("Service uninstallation failed")
         return False
 
 def start_service():
     """Start the Windows service"""
     try:
-        service_name = str(TaskClientService._svc_name_)
+        service_name = TaskClientService._svc_name_
         win32serviceutil.StartService(service_name)
         print(f"✓ Service '{TaskClientService._svc_display_name_}' started successfully")
         return True
@@ -564,7 +840,7 @@ def start_service():
 def stop_service():
     """Stop the Windows service"""
     try:
-        service_name = str(TaskClientService._svc_name_)
+        service_name = TaskClientService._svc_name_
         win32serviceutil.StopService(service_name)
         print(f"✓ Service '{TaskClientService._svc_display_name_}' stopped successfully")
         return True
@@ -575,7 +851,7 @@ def stop_service():
 def restart_service():
     """Restart the Windows service"""
     try:
-        service_name = str(TaskClientService._svc_name_)
+        service_name = TaskClientService._svc_name_
         win32serviceutil.RestartService(service_name)
         print(f"✓ Service '{TaskClientService._svc_display_name_}' restarted successfully")
         return True
@@ -586,30 +862,20 @@ def restart_service():
 def status_service():
     """Check service status"""
     try:
-        service_name = str(TaskClientService._svc_name_)
+        service_name = TaskClientService._svc_name_
         status = win32serviceutil.QueryServiceStatus(service_name)
-        status_text = {
-            win32service.SERVICE_STOPPED: "STOPPED",
-            win32service.SERVICE_START_PENDING: "START_PENDING",
-            win32service.SERVICE_STOP_PENDING: "STOP_PENDING",
-            win32service.SERVICE_RUNNING: "RUNNING",
-            win32service.SERVICE_CONTINUE_PENDING: "CONTINUE_PENDING",
-            win32service.SERVICE_PAUSE_PENDING: "PAUSE_PENDING",
-            win32service.SERVICE_PAUSED: "PAUSED"
-        }.get(status[1], "UNKNOWN")
+        status_text = _STATUS_NAMES.get(status[1], "UNKNOWN")
 
         print(f"Service Status: {status_text}")
 
         # Show config if service exists
-        config_file = Path("C:/WebGraphicsTask/config.json")
-        if config_file.exists():
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+        try:
+            config = _cached_json(_SERVICE_CONFIG_FILE)
+            if config is not None:
                 print(f"Server URL: {config.get('server_url', 'Unknown')}")
                 print(f"client Name: {config.get('client_name', 'Unknown')}")
-            except Exception:
-                pass
+        except Exception:
+            pass
 
         return True
 
@@ -649,22 +915,10 @@ def debug_service():
 
         print("\nTesting TaskClientRunner import and creation...")
         try:
-            from client.client_runner import TaskClientRunner
-            print("✓ TaskClientRunner imported successfully")
+            TaskClientRunner = _load_task_client_runner_cls()
         except ImportError as e:
-            print(f"❌ Direct import failed: {e}")
-            print("Trying alternative import method...")
-            import importlib.util
-            runner_path = os.path.join(project_root, 'client', 'client_runner.py')
-            if os.path.exists(runner_path):
-                spec = importlib.util.spec_from_file_location("client.client_runner", runner_path)
-                runner_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(runner_module)
-                TaskClientRunner = runner_module.TaskClientRunner
-                print("✓ TaskClientRunner imported via alternative method")
-            else:
-                print(f"❌ Runner file not found: {runner_path}")
-                return
+            print(f"❌ {e}")
+            return
 
         # Test creating runner instance
         if config:
@@ -674,8 +928,8 @@ def debug_service():
                 'heartbeat_interval': config.get('heartbeat_interval', 30),
                 'config_update_interval': config.get('config_update_interval', 600),
                 'log_level': config.get('log_level', 'INFO'),
-                'log_dir': os.path.join(os.path.dirname(__file__), 'logs'),
-                'work_dir': os.path.join(os.path.dirname(__file__), 'work')
+                'log_dir': _LOG_DIR,
+                'work_dir': _WORK_DIR
             }
         else:
             runner_config = {
@@ -684,8 +938,8 @@ def debug_service():
                 'heartbeat_interval': 30,
                 'config_update_interval': 600,
                 'log_level': 'INFO',
-                'log_dir': os.path.join(os.path.dirname(__file__), 'logs'),
-                'work_dir': os.path.join(os.path.dirname(__file__), 'work')
+                'log_dir': _LOG_DIR,
+                'work_dir': _WORK_DIR
             }
 
         try:
@@ -699,8 +953,7 @@ def debug_service():
 
     except Exception as e:
         print(f"❌ Debug failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _MODULE_LOGGER.exception("Service debug failed")
 
 
 def check_config():
@@ -710,12 +963,38 @@ def check_config():
         config = service._load_config()
         if config:
             print("Configuration loaded successfully:")
-            print(json.dumps(config, indent=2))
+            print(_dumps(config).decode('utf-8'))
         else:
             print("Configuration not found, will use defaults")
     except Exception as e:
         print(f"Configuration check failed: {e}")
 
+def _install_from_argv():
+    """Run install_service with --server-url / --client-name taken from sys.argv"""
+    server_url = None
+    client_name = None
+
+    # Parse additional arguments
+    for i, arg in enumerate(sys.argv):
+        if arg == '--server-url' and i + 1 < len(sys.argv):
+            server_url = sys.argv[i + 1]
+        elif arg == '--client-name' and i + 1 < len(sys.argv):
+            client_name = sys.argv[i + 1]
+
+    install_service(server_url, client_name)
+
+# Command-line verbs handled here; anything else goes to HandleCommandLine
+_CLI_COMMANDS = {
+    'install': _install_from_argv,
+    'debug': debug_service,
+    'check-config': check_config,
+    'uninstall': uninstall_service,
+    'start': start_service,
+    'stop': stop_service,
+    'restart': restart_service,
+    'status': status_service
+}
+
 if __name__ == '__main__':
     # Always fix the Python path first, regardless of how the script is called
     project_root = fix_service_path()
@@ -732,42 +1011,9 @@ if __name__ == '__main__':
         servicemanager.PrepareToHostSingle(TaskClientService)
         servicemanager.StartServiceCtrlDispatcher()
     else:
-        # Handle command line arguments
-        if 'install' in sys.argv:
-            server_url = None
-            client_name = None
-
-            # Parse additional arguments
-            for i, arg in enumerate(sys.argv):
-                if arg == '--server-url' and i + 1 < len(sys.argv):
-                    server_url = sys.argv[i + 1]
-                elif arg == '--client-name' and i + 1 < len(sys.argv):
-                    client_name = sys.argv[i + 1]
-
-            install_service(server_url, client_name)
-
-        elif 'debug' in sys.argv:
-            debug_service()
-
-        elif 'check-config' in sys.argv:
-            check_config()
-
-        elif 'uninstall' in sys.argv:
-            uninstall_service()
-
-        elif 'start' in sys.argv:
-            start_service()
-
-        elif 'stop' in sys.argv:
-            stop_service()
-
-        elif 'restart' in sys.argv:
-            restart_service()
-
-        elif 'status' in sys.argv:
-            status_service()
-
+        # Handle command line arguments: the command is the first argument
+        handler = _CLI_COMMANDS.get(sys.argv[1])
+        if handler:
+            handler()
         else:
             win32serviceutil.HandleCommandLine(TaskClientService)
-
-
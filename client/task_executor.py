@@ -3,77 +3,221 @@ Task executor for client.
 Responsible for executing tasks and reporting results (runs) to server.
 """
 import logging
+import logging.handlers
 import time
 import json
+import queue
 import requests
 import os
-from datetime import datetime
+import re
+import operator
+import threading
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-from common.tasks import execute_task, list_tasks
+from common.tasks import execute_task, get_task, list_tasks
 from common.models import JobStatus, TaskDefinition
 
+# Prefer orjson for report payloads and summary files when installed; stdlib
+# json otherwise. _dumps and _dumps_pretty always return UTF-8 encoded bytes.
+try:
+    import orjson
+    def _dumps(obj):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    def _dumps_pretty(obj):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+    def _dumps_pretty(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# (connect, read) timeout for final status reports; RUNNING is best-effort
+# telemetry and gets a short timeout so it never holds up the final report
+_REPORT_TIMEOUT = (3, 10)
+_RUNNING_REPORT_TIMEOUT = 1.0
+
+# Defaults for task fields missing from server job data, in TaskDefinition
+# positional order. None for args/kwargs lets TaskDefinition create fresh containers.
+_TASK_DEFAULTS = {
+    'name': '',
+    'client': '',
+    'order': 0,
+    'args': None,
+    'kwargs': None,
+    'timeout': 300,
+    'retry_count': 0,
+    'max_retries': 3
+}
+_task_fields = operator.itemgetter(*_TASK_DEFAULTS)
+_order_key = operator.attrgetter('order')
+
+# Root of the per-job log folders, next to this module
+_LOGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
+
+# Characters not allowed in task log folder names (word characters, spaces and '-' are kept)
+_CLEAN_RE = re.compile(r'[^\w \-]+')
+
+# Wire values of each status, resolved once instead of per report
+_STATUS_VALUES = {status: status.value for status in JobStatus}
+_RUNNING_VALUE = JobStatus.RUNNING.value
+
 logger = logging.getLogger(__name__)
 
+def _response_preview(response, limit: int = 512) -> str:
+    """Decode at most limit bytes of a response body for logging"""
+    return response.content[:limit].decode('utf-8', errors='replace')
+
+def _format_error(e: Exception, limit: int = 2048) -> str:
+    """Describe an exception as 'Type: message', capped for logs and reports"""
+    return f"{type(e).__name__}: {e}"[:limit]
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler with a 64 KiB buffer; only errors are flushed as they are written"""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=1 << 16, encoding=self.encoding)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves the log line layout to the listener thread"""
+
+    def prepare(self, record):
+        # Merge the args now: they can be live objects (Task arguments, result
+        # dicts) that change before the listener gets to the record. Timestamp,
+        # level and traceback layout are still done on the listener thread.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 class TaskExecutor:
     """Executes tasks and reports results (runs) to server"""
 
-    def __init__(self, server_url: str, client_name: str):
+    def __init__(self, server_url: str, client_name: str, running_report_delay: float = 0.5):
         self.server_url = server_url
         self.client_name = client_name
-        self.task_log_folder = None
-        self.task_logger = None
-
-    def _create_task_log_folder(self, task_name: str) -> str:
+        # Jobs may repeat an order without its tasks being independent, so
+        # tasks of the same order run one after another unless this is set;
+        # even then only task types marked parallel_safe run concurrently.
+        self.parallel_within_order = False
+        # Only the most recent results are kept in memory and in the summary;
+        # every result is still written to the execution log.
+        self.max_kept_results = 256
+
+        # Keep-alive session so status reports reuse pooled connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+        )
+        scheme = urlsplit(server_url).scheme or 'http'
+        self._session.mount(f"{scheme}://", adapter)
+
+        # RUNNING is only reported for tasks still executing after this many
+        # seconds; shorter tasks send just their final status.
+        self.running_report_delay = running_report_delay
+
+        # Status reports are buffered and sent in batches by a background
+        # thread; RUNNING is still sent live for tasks whose timeout exceeds
+        # live_report_timeout.
+        self._report_buffer = []
+        self._report_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_threshold = 16
+        self._flush_interval = 5.0
+        self.live_report_timeout = 60
+        self._closed = False
+        self._flush_wakeup = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_worker, name='task-report-flush', daemon=True
+        )
+        self._flush_thread.start()
+
+    def close(self):
+        """Send pending reports, then release HTTP connections"""
+        self._closed = True
+        self._flush_wakeup.set()
+        self._flush_thread.join(timeout=15)
+        self._flush_reports()
+        self._session.close()
+
+    def _create_task_log_folder(self, task_name: str,
+                                start_time: Optional[datetime] = None) -> str:
         """
         Create timestamped log folder for task execution
 
         Args:
             task_name: Name of the task
+            start_time: Execution start time (defaults to now)
 
         Returns:
             Path to the created log folder
         """
         # Create timestamp in format yyyymmddhhmmss
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        timestamp = (start_time or datetime.now()).strftime("%Y%m%d%H%M%S")
 
         # Clean task name for folder name (remove invalid characters)
-        clean_task_name = "".join(c for c in task_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        clean_task_name = clean_task_name.replace(' ', '_')
+        clean_task_name = _CLEAN_RE.sub('', task_name).rstrip().replace(' ', '_')
 
         # Create folder name: [timestamp]-[taskname]
         folder_name = f"[{timestamp}]-[{clean_task_name}]"
 
         # Create full path
-        logs_dir = os.path.join(os.path.dirname(__file__), 'logs')
-        task_log_folder = os.path.join(logs_dir, folder_name)
-
-        # Create directories if they don't exist
-        os.makedirs(task_log_folder, exist_ok=True)
-
-        return task_log_folder
+        task_log_folder = os.path.join(_LOGS_DIR, folder_name)
+
+        # One mkdir on the common path; the logs directory is created on first
+        # use, and a second run of the same task within the same second gets
+        # its own numbered folder instead of sharing the first one
+        candidate = task_log_folder
+        suffix = 1
+        while True:
+            try:
+                os.mkdir(candidate)
+                return candidate
+            except FileNotFoundError:
+                os.makedirs(_LOGS_DIR, exist_ok=True)
+            except FileExistsError:
+                suffix += 1
+                candidate = f"{task_log_folder}_{suffix}"
 
     def _setup_task_logger(self, task_log_folder: str, task_name: str):
         """
-        Set up dedicated logger for task execution
+        Set up dedicated logger for one job execution
+
+        The logger belongs to the calling execute_job_tasks, so jobs running
+        concurrently on this executor each write their own execution.log.
 
         Args:
             task_log_folder: Path to task log folder
             task_name: Name of the task
-        """
-        # Create task-specific logger
-        task_logger_name = f"task_execution_{task_name}"
-        self.task_logger = logging.getLogger(task_logger_name)
-
-        # Remove existing handlers to avoid duplicates
-        for handler in self.task_logger.handlers[:]:
-            self.task_logger.removeHandler(handler)
 
-        # Set log level
-        self.task_logger.setLevel(logging.INFO)
+        Returns:
+            (task_logger, listener) pair, to be released with _stop_task_log
+        """
+        # Not registered through logging.getLogger: every execution gets its
+        # own logger, even for jobs with the same name, and it is freed with it
+        task_logger = logging.Logger(f"task_execution_{task_name}", logging.INFO)
 
         # Create file handler for task execution log
         execution_log_file = os.path.join(task_log_folder, 'execution.log')
-        file_handler = logging.FileHandler(execution_log_file, encoding='utf-8')
+        file_handler = _BufferedFileHandler(execution_log_file, encoding='utf-8')
 
         # Create detailed formatter
         formatter = logging.Formatter(
@@ -82,13 +226,31 @@ class TaskExecutor:
         )
         file_handler.setFormatter(formatter)
 
-        # Add handler to logger
-        self.task_logger.addHandler(file_handler)
+        # Task threads only enqueue records; a listener thread formats and
+        # writes them, so large argument and result dumps cost the task nothing
+        log_queue = queue.Queue()
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        task_logger.addHandler(_DeferredQueueHandler(log_queue))
 
         # Don't propagate to parent logger to avoid duplicate logs
-        self.task_logger.propagate = False
-
-    def execute_job_tasks(self, task_id: int, task_name: str, tasks: List[TaskDefinition]) -> Dict[str, Any]:
+        task_logger.propagate = False
+
+        return task_logger, listener
+
+    @staticmethod
+    def _stop_task_log(task_logger: logging.Logger, listener: logging.handlers.QueueListener):
+        """Detach a job's task log, writing out anything still queued"""
+        for handler in task_logger.handlers[:]:
+            task_logger.removeHandler(handler)
+        # Late report logging for this job is dropped rather than sent to stderr
+        task_logger.addHandler(logging.NullHandler())
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+    def execute_job_tasks(self, task_id: int, task_name: str, tasks: List[TaskDefinition],
+                          already_sorted: bool = False) -> Dict[str, Any]:
         """
         Execute all tasks for this client in the given task
 
@@ -96,115 +258,181 @@ class TaskExecutor:
             task_id: ID of the task
             task_name: Name of the task
             tasks: List of tasks to execute
+            already_sorted: True if tasks are already limited to this client and sorted by order
 
         Returns:
             Overall execution result
         """
-        # Create timestamped log folder for this task execution
-        self.task_log_folder = self._create_task_log_folder(task_name)
-        self._setup_task_logger(self.task_log_folder, task_name)
-
-        # Log task start
-        start_time = datetime.now()
-        self.task_logger.info(f"=== TASK EXECUTION STARTED ===")
-        self.task_logger.info(f"Task ID: {task_id}")
-        self.task_logger.info(f"Task Name: {task_name}")
-        self.task_logger.info(f"client: {self.client_name}")
-        self.task_logger.info(f"Start Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        self.task_logger.info(f"Log Folder: {self.task_log_folder}")
-
-        # Filter tasks for this client
-        my_tasks = [s for s in tasks if s.client == self.client_name]
-
-        if not my_tasks:
-            self.task_logger.info(f"No tasks assigned to client {self.client_name}")
-            logger.info(f"No tasks assigned to client {self.client_name} for task {task_id}")
+        # Nothing for this client: return before creating a log folder
+        client_name = self.client_name
+        if not (tasks if already_sorted else any(s.client == client_name for s in tasks)):
+            logger.info("No tasks assigned to client %s for task %s", client_name, task_id)
             return {
                 'success': True,
                 'executed_count': 0,
+                'failed_count': 0,
+                'total_count': 0,
                 'message': 'No tasks assigned to this client'
             }
 
-        # Sort by order
-        my_tasks.sort(key=lambda x: x.order)
+        # Wall-clock start for folder name and logs; elapsed time is measured
+        # on the monotonic clock
+        start_time = datetime.now()
+        start_ns = time.monotonic_ns()
+
+        # Create timestamped log folder and logger for this task execution;
+        # both stay local so concurrent jobs do not share them
+        task_log_folder = self._create_task_log_folder(task_name, start_time)
+        task_logger, task_log_listener = self._setup_task_logger(task_log_folder, task_name)
+
+        try:
+            # Log task start
+            task_logger.info("=== TASK EXECUTION STARTED ===")
+            task_logger.info("Task ID: %s", task_id)
+            task_logger.info("Task Name: %s", task_name)
+            task_logger.info("client: %s", self.client_name)
+            task_logger.info("Start Time: %s", start_time.strftime('%Y-%m-%d %H:%M:%S'))
+            task_logger.info("Log Folder: %s", task_log_folder)
+
+            # Filter tasks for this client
+            if already_sorted:
+                my_tasks = tasks
+            else:
+                my_tasks = [s for s in tasks if s.client == client_name]
+
+            # Sort by order
+            if not already_sorted:
+                my_tasks.sort(key=_order_key)
 
-        self.task_logger.info(f"Found {len(my_tasks)} tasks assigned to this client")
-        for i, Task in enumerate(my_tasks):
-            self.task_logger.info(f"  {i+1}. {Task.name} (order: {Task.order})")
+            task_logger.info("Found %s tasks assigned to this client", len(my_tasks))
+            for i, Task in enumerate(my_tasks):
+                task_logger.info("  %s. %s (order: %s)", i + 1, Task.name, Task.order)
 
-        logger.info(f"Executing {len(my_tasks)} tasks for task {task_id}")
+            logger.info("Executing %s tasks for task %s", len(my_tasks), task_id)
 
-        executed_count = 0
-        failed_count = 0
-        results = []
+            executed_count = 0
+            failed_count = 0
+            results = deque(maxlen=self.max_kept_results)
 
-        for Task in my_tasks:
             try:
-                self.task_logger.info(f"--- Starting Task: {Task.name} ---")
-                result = self.execute_single_task(task_id, Task)
-                results.append(result)
-
-                if result['success']:
-                    executed_count += 1
-                    self.task_logger.info(f"✓ Task {Task.name} completed successfully")
-                    self.task_logger.info(f"  Execution time: {result.get('execution_time', 0):.2f} seconds")
-                    self.task_logger.info(f"  Result: {result.get('result', 'No result')}")
-                    logger.info(f"Task {Task.name} completed successfully")
-                else:
-                    failed_count += 1
-                    error_msg = result.get('error', 'Unknown error')
-                    self.task_logger.error(f"✗ Task {Task.name} failed: {error_msg}")
-                    logger.error(f"Task {Task.name} failed: {error_msg}")
-
-                    # Stop execution on failure if configured to do so
-                    # For now, continue with remaining tasks
-
-            except Exception as e:
-                failed_count += 1
-                error_msg = str(e)
-                self.task_logger.error(f"✗ Exception executing Task {Task.name}: {error_msg}")
-                logger.error(f"Exception executing Task {Task.name}: {e}")
-                results.append({
-                    'success': False,
-                    'task_name': Task.name,
-                    'error': error_msg
-                })
-
-        overall_success = failed_count == 0
-        end_time = datetime.now()
-        total_execution_time = (end_time - start_time).total_seconds()
-
-        # Log task completion
-        self.task_logger.info(f"=== TASK EXECUTION COMPLETED ===")
-        self.task_logger.info(f"End Time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        self.task_logger.info(f"Total Execution Time: {total_execution_time:.2f} seconds")
-        self.task_logger.info(f"Overall Success: {overall_success}")
-        self.task_logger.info(f"Executed: {executed_count}/{len(my_tasks)} tasks")
-        if failed_count > 0:
-            self.task_logger.info(f"Failed: {failed_count} tasks")
-
-        # Write summary file
-        self._write_task_summary(task_id, task_name, start_time, end_time,
-                                executed_count, failed_count, len(my_tasks), results)
-
-        return {
-            'success': overall_success,
-            'executed_count': executed_count,
-            'failed_count': failed_count,
-            'total_count': len(my_tasks),
-            'results': results,
-            'message': f"Executed {executed_count}/{len(my_tasks)} tasks successfully",
-            'execution_time': total_execution_time,
-            'log_folder': self.task_log_folder
-        }
+                for order, group in itertools.groupby(my_tasks, key=_order_key):
+                    group = list(group)
+                    # Results stay at their Task's position so the summary
+                    # follows the job definition whatever finishes first
+                    group_results = [None] * len(group)
+                    parallel = []
+                    if self.parallel_within_order:
+                        parallel = [i for i, Task in enumerate(group) if self._is_parallel_safe(Task)]
+
+                    if len(parallel) > 1:
+                        task_logger.info("Running %s tasks of order %s in parallel", len(parallel), order)
+                        max_workers = min(len(parallel), (os.cpu_count() or 1) * 4)
+                        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                            futures = [(i, pool.submit(self._run_task, task_id, group[i], task_logger))
+                                       for i in parallel]
+                            for i, future in futures:
+                                group_results[i] = future.result()
+                    for i, Task in enumerate(group):
+                        if group_results[i] is None:
+                            group_results[i] = self._run_task(task_id, Task, task_logger)
+
+                    for result in group_results:
+                        results.append(result)
+                        if result['success']:
+                            executed_count += 1
+                        else:
+                            failed_count += 1
+            finally:
+                self._flush_reports()
+
+            overall_success = failed_count == 0
+            total_execution_time = (time.monotonic_ns() - start_ns) / 1e9
+            end_time = start_time + timedelta(seconds=total_execution_time)
+
+            # Log task completion
+            task_logger.info("=== TASK EXECUTION COMPLETED ===")
+            task_logger.info("End Time: %s", end_time.strftime('%Y-%m-%d %H:%M:%S'))
+            task_logger.info("Total Execution Time: %.2f seconds", total_execution_time)
+            task_logger.info("Overall Success: %s", overall_success)
+            task_logger.info("Executed: %s/%s tasks", executed_count, len(my_tasks))
+            if failed_count > 0:
+                task_logger.info("Failed: %s tasks", failed_count)
+
+            results = list(results)
+            omitted_count = executed_count + failed_count - len(results)
+
+            # Write summary file
+            self._write_task_summary(task_log_folder, task_logger, task_id, task_name, start_time, end_time,
+                                     executed_count, failed_count, len(my_tasks), results)
+
+            return {
+                'success': overall_success,
+                'executed_count': executed_count,
+                'failed_count': failed_count,
+                'total_count': len(my_tasks),
+                'results': results,
+                'omitted_count': omitted_count,
+                'message': f"Executed {executed_count}/{len(my_tasks)} tasks successfully",
+                'execution_time': total_execution_time,
+                'log_folder': task_log_folder
+            }
+        finally:
+            self._stop_task_log(task_logger, task_log_listener)
+
+    def _is_parallel_safe(self, Task: TaskDefinition) -> bool:
+        """Whether a Task may run alongside other tasks of the same order"""
+        task_type = get_task(Task.name)
+        return task_type is not None and task_type.parallel_safe
+
+    def _run_task(self, task_id: int, Task: TaskDefinition,
+                  task_logger: logging.Logger) -> Dict[str, Any]:
+        """
+        Execute a single Task and log its outcome, never raising
+
+        Args:
+            task_id: ID of the task
+            Task: task definition to execute
+            task_logger: Logger of the job's execution log
+
+        Returns:
+            Execution result
+        """
+        try:
+            task_logger.info("--- Starting Task: %s ---", Task.name)
+            result = self.execute_single_task(task_id, Task, task_logger)
 
-    def _write_task_summary(self, task_id: int, task_name: str, start_time: datetime,
+            # execute_single_task already wrote the outcome to the execution
+            # log; only the console gets its one-line summary here
+            if result['success']:
+                logger.info("Task %s completed successfully", Task.name)
+            else:
+                logger.error("Task %s failed: %s", Task.name, result.get('error', 'Unknown error'))
+
+                # Stop execution on failure if configured to do so
+                # For now, continue with remaining tasks
+
+            return result
+
+        except Exception as e:
+            error_msg = _format_error(e)
+            task_logger.error("✗ Exception executing Task %s: %s", Task.name, error_msg)
+            logger.error("Exception executing Task %s: %s", Task.name, error_msg)
+            return {
+                'success': False,
+                'task_name': Task.name,
+                'error': error_msg
+            }
+
+    def _write_task_summary(self, task_log_folder: str, task_logger: logging.Logger,
+                           task_id: int, task_name: str, start_time: datetime,
                            end_time: datetime, executed_count: int, failed_count: int,
                            total_count: int, results: List[Dict[str, Any]]):
         """
         Write task execution summary to a JSON file
 
         Args:
+            task_log_folder: Path to the job's log folder
+            task_logger: Logger of the job's execution log
             task_id: ID of the task
             task_name: Name of the task
             start_time: Task start time
@@ -212,9 +440,9 @@ class TaskExecutor:
             executed_count: Number of successfully executed tasks
             failed_count: Number of failed tasks
             total_count: Total number of tasks
-            results: List of Task execution results
+            results: List of the most recent Task execution results
         """
-        if not self.task_log_folder:
+        if not task_log_folder:
             return
 
         summary_data = {
@@ -232,78 +460,96 @@ class TaskExecutor:
                 'total_tasks': total_count,
                 'executed_successfully': executed_count,
                 'failed': failed_count,
-                'success_rate': (executed_count / total_count * 100) if total_count > 0 else 0
+                'success_rate': (executed_count / total_count * 100) if total_count > 0 else 0,
+                'omitted_results': executed_count + failed_count - len(results)
             },
             'task_results': results
         }
 
-        summary_file = os.path.join(self.task_log_folder, 'task_summary.json')
+        summary_file = os.path.join(task_log_folder, 'task_summary.json')
         try:
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(summary_data, f, indent=2, ensure_ascii=False)
-            self.task_logger.info(f"Task summary written to: {summary_file}")
+            with open(summary_file, 'wb') as f:
+                f.write(_dumps_pretty(summary_data))
+            task_logger.info("Task summary written to: %s", summary_file)
         except Exception as e:
-            self.task_logger.error(f"Failed to write task summary: {e}")
-            logger.error(f"Failed to write task summary: {e}")
+            task_logger.error("Failed to write task summary: %s", e)
+            logger.error("Failed to write task summary: %s", e)
 
-    def execute_single_task(self, task_id: int, Task: TaskDefinition) -> Dict[str, Any]:
+    def execute_single_task(self, task_id: int, Task: TaskDefinition,
+                            task_logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
         """
         Execute a single Task and report result to server
 
         Args:
             task_id: ID of the task
             Task: task definition to execute
+            task_logger: Logger of the job's execution log, if any
 
         Returns:
             Execution result
         """
-        logger.info(f"Starting Task: {Task.name} (order: {Task.order})")
-        if self.task_logger:
-            self.task_logger.info(f"Executing Task: {Task.name}")
-            self.task_logger.info(f"  Order: {Task.order}")
-            self.task_logger.info(f"  Target client: {Task.client}")
+        if task_logger:
+            task_logger.info("Executing Task: %s", Task.name)
+            task_logger.info("  Order: %s", Task.order)
+            task_logger.info("  Target client: %s", Task.client)
             if Task.args:
-                self.task_logger.info(f"  Arguments: {Task.args}")
+                task_logger.info("  Arguments: %s", Task.args)
             if Task.kwargs:
-                self.task_logger.info(f"  Keyword arguments: {Task.kwargs}")
+                task_logger.info("  Keyword arguments: %s", Task.kwargs)
 
         # Report Task started with enhanced logging
-        logger.info(f"🏃 TASK_START: Task {task_id} - '{Task.name}' execution starting on client '{self.client_name}'")
-        if self.task_logger:
-            self.task_logger.info(f"🏃 Starting execution of Task '{Task.name}' (order: {Task.order})")
+        logger.info("🏃 TASK_START: Task %s - '%s' (order: %s) execution starting on client '%s'",
+                    task_id, Task.name, Task.order, self.client_name)
+
+        # Fields shared by every report for this Task, built once
+        report_base = {
+            'task_name': Task.name,
+            'client': self.client_name,
+            'order': Task.order
+        }
 
-        self._report_task_status(task_id, Task, JobStatus.RUNNING)
+        running_timer = threading.Timer(
+            self.running_report_delay, self._report_task_status,
+            args=(task_id, Task, JobStatus.RUNNING),
+            kwargs={'report_base': report_base, 'task_logger': task_logger}
+        )
+        running_timer.daemon = True
+        running_timer.start()
 
-        start_time = time.time()
+        # Monotonic clock: durations are unaffected by wall-clock adjustments
+        start_ns = time.monotonic_ns()
 
         try:
-            if self.task_logger:
-                self.task_logger.info(f"Calling execute_task({Task.name}, {Task.args}, {Task.kwargs})")
+            if task_logger:
+                task_logger.info("Calling execute_task(%s, %s, %s)", Task.name, Task.args, Task.kwargs)
 
             # Execute the Task
-            result = execute_task(
-                Task.name,
-                *Task.args,
-                **Task.kwargs
-            )
+            result = execute_task(Task.name, *Task.args, **Task.kwargs)
+
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
 
-            execution_time = time.time() - start_time
+            # Skip RUNNING if it has not fired yet; if it has, the server
+            # must see it before the final status
+            running_timer.cancel()
+            running_timer.join()
 
-            if self.task_logger:
-                self.task_logger.info(f"Task execution completed in {execution_time:.2f} seconds")
-                self.task_logger.info(f"Raw result: {result}")
+            if task_logger:
+                task_logger.info("Task execution completed in %.2f seconds", execution_time)
+                task_logger.info("Raw result: %s", result)
 
             if result['success']:
                 # Report successful completion
                 self._report_task_status(
                     task_id, Task, JobStatus.COMPLETED,
                     result=result['result'],
-                    execution_time=execution_time
+                    execution_time=execution_time,
+                    report_base=report_base,
+                    task_logger=task_logger
                 )
 
-                if self.task_logger:
-                    self.task_logger.info(f"✓ Task {Task.name} completed successfully")
-                    self.task_logger.info(f"  Final result: {result['result']}")
+                if task_logger:
+                    task_logger.info("✓ Task %s completed successfully", Task.name)
+                    task_logger.info("  Final result: %s", result['result'])
 
                 return {
                     'success': True,
@@ -317,11 +563,13 @@ class TaskExecutor:
                 self._report_task_status(
                     task_id, Task, JobStatus.FAILED,
                     error_message=error_msg,
-                    execution_time=execution_time
+                    execution_time=execution_time,
+                    report_base=report_base,
+                    task_logger=task_logger
                 )
 
-                if self.task_logger:
-                    self.task_logger.error(f"✗ Task {Task.name} failed: {error_msg}")
+                if task_logger:
+                    task_logger.error("✗ Task %s failed: %s", Task.name, error_msg)
 
                 return {
                     'success': False,
@@ -331,18 +579,26 @@ class TaskExecutor:
                 }
 
         except Exception as e:
-            execution_time = time.time() - start_time
-            error_msg = str(e)
+            execution_time = (time.monotonic_ns() - start_ns) / 1e9
+            error_msg = _format_error(e)
+            running_timer.cancel()
+            running_timer.join()
 
-            if self.task_logger:
-                self.task_logger.error(f"✗ Exception during Task {Task.name} execution: {error_msg}")
-                self.task_logger.error(f"  Execution time before exception: {execution_time:.2f} seconds")
+            # Tracebacks only when debugging; failures can be frequent
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Task %s raised", Task.name, exc_info=True)
+
+            if task_logger:
+                task_logger.error("✗ Exception during Task %s execution: %s", Task.name, error_msg)
+                task_logger.error("  Execution time before exception: %.2f seconds", execution_time)
 
             # Report exception
             self._report_task_status(
                 task_id, Task, JobStatus.FAILED,
                 error_message=error_msg,
-                execution_time=execution_time
+                execution_time=execution_time,
+                report_base=report_base,
+                task_logger=task_logger
             )
 
             return {
@@ -354,60 +610,141 @@ class TaskExecutor:
 
     def _report_task_status(self, task_id: int, Task: TaskDefinition,
                               status: JobStatus, result: Any = None,
-                              error_message: str = None, execution_time: float = None):
+                              error_message: str = None, execution_time: float = None,
+                              report_base: Dict[str, Any] = None,
+                              task_logger: Optional[logging.Logger] = None):
         """Report Task execution status to server"""
         try:
+            if report_base is None:
+                report_base = {'task_name': Task.name, 'client': self.client_name, 'order': Task.order}
+
+            # A new dict per report, since queued reports must not share state
             data = {
-                'task_name': Task.name,
-                'client': self.client_name,
-                'status': status.value,
-                'order': Task.order
+                **report_base,
+                'status': _STATUS_VALUES[status],
+                # Sent as a native value (null when absent); the server stores non-strings as JSON
+                'result': result
             }
 
-            if result is not None:
-                # Ensure result is properly serialized
-                if isinstance(result, str):
-                    data['result'] = result
-                else:
-                    data['result'] = json.dumps(result, ensure_ascii=False, default=str)
-
             if error_message:
                 data['error_message'] = error_message
 
             if execution_time is not None:
                 data['execution_time'] = execution_time
 
-            url = f"{self.server_url}/api/jobs/{task_id}/runs"
+            # A task definition may carry timeout: null; treat it as short
+            if status != JobStatus.RUNNING or (Task.timeout or 0) <= self.live_report_timeout:
+                self._queue_report(task_id, data, task_logger)
+                return
 
-            response = requests.post(url, json=data, timeout=10)
+            # Only live RUNNING reports are posted directly
+            url = self._runs_url(task_id)
+
+            response = self._session.post(url, data=_dumps(data), headers=_JSON_HEADERS,
+                                          timeout=_RUNNING_REPORT_TIMEOUT)
 
             if response.status_code == 200:
                 # Enhanced logging for successful result reporting
-                logger.info(f"📤 REPORT_SUCCESS: Task {task_id} - '{Task.name}' status '{status.value}' reported to server")
-                if self.task_logger:
-                    self.task_logger.info(f"✅ Successfully reported Task '{Task.name}' status '{status.value}' to server")
-                    if result is not None and status == JobStatus.COMPLETED:
-                        result_preview = str(result)[:100] + "..." if len(str(result)) > 100 else str(result)
-                        self.task_logger.info(f"REPORT_RESULT: Sent result to server: {result_preview}")
-                    elif error_message and status == JobStatus.FAILED:
-                        error_preview = str(error_message)[:100] + "..." if len(str(error_message)) > 100 else str(error_message)
-                        self.task_logger.info(f"REPORT_ERROR: Sent error to server: {error_preview}")
-
-                logger.debug(f"Reported Task {Task.name} status: {status.value}")
-                if self.task_logger:
-                    self.task_logger.info(f"Successfully reported Task {Task.name} status to server")
+                logger.info("📤 REPORT_SUCCESS: Task %s - '%s' status '%s' reported to server", task_id, Task.name, status.value)
+                if task_logger:
+                    task_logger.info("✅ Successfully reported Task '%s' status '%s' to server", Task.name, status.value)
             else:
                 # Enhanced logging for failed result reporting
-                logger.error(f"❌ REPORT_FAILED: Task {task_id} - '{Task.name}' status report failed: {response.status_code}")
-                logger.warning(f"Failed to report Task status: {response.status_code} - {response.text}")
-                if self.task_logger:
-                    self.task_logger.error(f"❌ Failed to report Task '{Task.name}' status to server: {response.status_code}")
-                    self.task_logger.warning(f"Failed to report Task status: {response.status_code} - {response.text}")
+                logger.error("❌ REPORT_FAILED: Task %s - '%s' status report failed: %s", task_id, Task.name, response.status_code)
+                logger.warning("Failed to report Task status: %s - %s", response.status_code, _response_preview(response))
+                if task_logger:
+                    task_logger.error("❌ Failed to report Task '%s' status to server: %s", Task.name, response.status_code)
+                    task_logger.warning("Failed to report Task status: %s - %s", response.status_code, _response_preview(response))
 
         except Exception as e:
-            logger.error(f"Error reporting Task status: {e}")
-            if self.task_logger:
-                self.task_logger.error(f"Error reporting Task status: {e}")
+            logger.error("Error reporting Task status: %s", e)
+            if task_logger:
+                task_logger.error("Error reporting Task status: %s", e)
+
+    def _runs_url(self, task_id: int) -> str:
+        """Return the run reporting URL for a job"""
+        return f"{self.server_url}/api/jobs/{task_id}/runs"
+
+    def _queue_report(self, task_id: int, data: Dict[str, Any],
+                      task_logger: Optional[logging.Logger] = None):
+        """Buffer a status report, waking the flush thread once the buffer is full"""
+        with self._report_lock:
+            self._report_buffer.append((task_id, data, task_logger))
+            flush_due = len(self._report_buffer) >= self._flush_threshold
+
+        if flush_due:
+            self._flush_wakeup.set()
+
+    def _flush_worker(self):
+        """Send buffered reports when woken, and at least every flush interval"""
+        while not self._closed:
+            self._flush_wakeup.wait(self._flush_interval)
+            self._flush_wakeup.clear()
+            self._flush_reports()
+
+    def _flush_reports(self):
+        """Send buffered status reports as one batch request per job"""
+        # Serialize flushes so reports for a Task reach the server in order
+        with self._flush_lock:
+            with self._report_lock:
+                pending = self._report_buffer
+                self._report_buffer = []
+
+            # Coalesce per Task: a queued RUNNING report is superseded by a
+            # later report for the same Task in this batch, which the server
+            # applies to the same run record anyway
+            reports_by_job = {}
+            loggers_by_job = {}
+            running_index = {}
+            for task_id, data, task_logger in pending:
+                reports = reports_by_job.setdefault(task_id, [])
+                if task_logger:
+                    loggers_by_job[task_id] = task_logger
+                key = (task_id, data['task_name'], data['order'])
+                index = running_index.pop(key, None)
+                if index is not None:
+                    reports[index] = data
+                else:
+                    index = len(reports)
+                    reports.append(data)
+                if data['status'] == _RUNNING_VALUE:
+                    running_index[key] = index
+
+            for task_id, reports in reports_by_job.items():
+                task_logger = loggers_by_job.get(task_id)
+                url = f"{self._runs_url(task_id)}/batch"
+                try:
+                    response = self._session.post(url, data=_dumps({'reports': reports}),
+                                                  headers=_JSON_HEADERS, timeout=_REPORT_TIMEOUT)
+
+                    if response.status_code == 200:
+                        # The server applies each report on its own and lists the rejected ones
+                        try:
+                            errors = response.json().get('errors') or []
+                        except ValueError:
+                            errors = []
+                        applied = len(reports) - len(errors)
+                        logger.info("📤 REPORT_SUCCESS: Task %s - %s status reports sent to server", task_id, applied)
+                        if task_logger:
+                            task_logger.info("✅ Successfully reported %s Task status updates to server", applied)
+                        for error in errors:
+                            index = error.get('index')
+                            data = reports[index] if isinstance(index, int) and 0 <= index < len(reports) else {}
+                            logger.error("❌ REPORT_FAILED: Task %s - '%s' status '%s' rejected by server: %s",
+                                         task_id, data.get('task_name'), data.get('status'), error.get('error'))
+                            if task_logger:
+                                task_logger.error("❌ Server rejected status '%s' for Task %s: %s",
+                                                       data.get('status'), data.get('task_name'), error.get('error'))
+                    else:
+                        logger.error("❌ REPORT_FAILED: Task %s - batch status report failed: %s", task_id, response.status_code)
+                        logger.warning("Failed to report Task status: %s - %s", response.status_code, _response_preview(response))
+                        if task_logger:
+                            task_logger.error("❌ Failed to report %s Task status updates to server: %s", len(reports), response.status_code)
+
+                except Exception as e:
+                    logger.error("Error reporting Task status: %s", e)
+                    if task_logger:
+                        task_logger.error("Error reporting Task status: %s", e)
 
     def get_available_tasks(self) -> List[str]:
         """Get list of available tasks on this client"""
@@ -416,12 +753,12 @@ class TaskExecutor:
     def test_task(self, task_name: str, *args, **kwargs) -> Dict[str, Any]:
         """Test a Task execution locally (for debugging)"""
         try:
-            logger.info(f"Testing Task: {task_name}")
+            logger.info("Testing Task: %s", task_name)
             result = execute_task(task_name, *args, **kwargs)
-            logger.info(f"Test result: {result}")
+            logger.info("Test result: %s", result)
             return result
         except Exception as e:
-            logger.error(f"Test Task failed: {e}")
+            logger.error("Test Task failed: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -431,9 +768,15 @@ class TaskExecutor:
 class TaskAdapter:
     """Adapter to dispatch job task execution"""
 
+    __slots__ = ('executor',)
+
     def __init__(self, server_url: str, client_name: str):
         self.executor = TaskExecutor(server_url, client_name)
 
+    def close(self):
+        """Release resources held by the executor"""
+        self.executor.close()
+
     def execute_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute task - either legacy Task-based or new task-based
@@ -449,27 +792,21 @@ class TaskAdapter:
 
         # Execute tasks from job data
         if 'tasks' in task_data and task_data['tasks']:
-            logger.info(f"Executing job {task_id}: {task_name}")
+            logger.info("Executing job %s: %s", task_id, task_name)
             return self._execute_task_job(task_id, task_name, task_data['tasks'])
         else:
-            logger.warning(f"Job {task_id} has no tasks defined")
+            logger.warning("Job %s has no tasks defined", task_id)
             return {'success': False, 'error': 'No tasks defined in job'}
 
     def _execute_task_job(self, task_id: int, task_name: str, tasks_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Execute tasks within a job"""
-        task_defs = []
-        for td in tasks_data:
-            task_def = TaskDefinition(
-                name=td.get('name', ''),
-                client=td.get('client', ''),
-                order=td.get('order', 0),
-                args=td.get('args', []),
-                kwargs=td.get('kwargs', {}),
-                timeout=td.get('timeout', 300),
-                retry_count=td.get('retry_count', 0),
-                max_retries=td.get('max_retries', 3)
-            )
-            task_defs.append(task_def)
+        # Drop other clients' tasks before building definitions for them
+        client_name = self.executor.client_name
+        local_tasks = [td for td in tasks_data if td.get('client', '') == client_name]
+
+        task_defs = [TaskDefinition(*_task_fields({**_TASK_DEFAULTS, **td})) for td in local_tasks]
+        # The server stores job tasks sorted by order, so this is normally a single linear pass
+        task_defs.sort(key=_order_key)
 
-        return self.executor.execute_job_tasks(task_id, task_name, task_defs)
+        return self.executor.execute_job_tasks(task_id, task_name, task_defs, already_sorted=True)
 
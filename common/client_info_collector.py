@@ -15,11 +15,34 @@ import logging
 import importlib
 import sys
 import os
+import time
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# System summary reported when collection fails (read-only; copied into each fallback)
+_UNKNOWN_SYSTEM_SUMMARY = MappingProxyType({
+    'cpu': 'Unknown',
+    'memory': 'Unknown',
+    'gpu': 'Unknown',
+    'os': 'Unknown',
+    'hostname': 'unknown',
+    'ip': '127.0.0.1'
+})
+
+
+def _client_info_fields(system_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Map system_info sections to the client record fields sent to the server"""
+    return {
+        'cpu_info': system_info.get('cpu'),
+        'memory_info': system_info.get('memory'),
+        'gpu_info': system_info.get('gpu'),
+        'os_info': system_info.get('os'),
+        'disk_info': system_info.get('disk')
+    }
+
 
 class ClientInfoCollector:
     """
@@ -28,59 +51,93 @@ class ClientInfoCollector:
     """
     
     def __init__(self):
-        self._system_info_module = None
+        self._get_system_info = None
+        self._get_system_summary = None
+        self._get_memory_info = None
+        self._get_network_info = None
+        self._get_disk_info = None
         self._last_reload_time = None
+        self._module_mtime = None
         self._collection_cache = {}
         self._cache_duration = 5  # Cache for 5 seconds to avoid repeated calls
+        # CPU, GPU and OS details rarely change and are the expensive probes,
+        # so unforced collections reuse them for longer
+        self._static_info = None
+        self._static_info_time = None
+        self._static_info_duration = 300
         
-    def _ensure_system_info_module(self):
-        """Ensure system_info module is loaded and up-to-date"""
+    @staticmethod
+    def _source_mtime(module) -> Optional[int]:
+        """Get the modification time of a module's source file, if known"""
+        try:
+            return os.stat(module.__file__).st_mtime_ns
+        except (AttributeError, TypeError, OSError):
+            return None
+    
+    def _ensure_system_info_module(self, force: bool = False):
+        """
+        Ensure system_info module is loaded and up-to-date
+        
+        The module is reloaded only when its source file changed since the
+        last load (or when forced). Only common.system_info itself is
+        reloaded; modules it imports keep their loaded versions.
+        
+        Args:
+            force: Reload even if the source file is unchanged
+        """
         try:
             # Import or reload the system_info module
-            if 'common.system_info' in sys.modules:
-                # Reload existing module to get latest changes
-                importlib.reload(sys.modules['common.system_info'])
-                logger.debug("Reloaded common.system_info module")
+            module = sys.modules.get('common.system_info')
+            if module is not None:
+                mtime = self._source_mtime(module)
+                if force or mtime is None or mtime != self._module_mtime:
+                    # Reload existing module to get latest changes
+                    importlib.reload(module)
+                    self._last_reload_time = datetime.now()
+                    logger.debug("Reloaded common.system_info module")
+                elif self._get_system_info is not None:
+                    return
             else:
                 # First-time import
                 logger.debug("Loading common.system_info module")
+                self._last_reload_time = datetime.now()
             
-            from common.system_info import get_system_info, get_system_summary
-            self._system_info_module = {
-                'get_system_info': get_system_info,
-                'get_system_summary': get_system_summary
-            }
-            self._last_reload_time = datetime.now()
+            from common.system_info import (
+                get_system_info, get_system_summary,
+                get_memory_info, get_network_info, get_disk_info
+            )
+            self._get_system_info = get_system_info
+            self._get_system_summary = get_system_summary
+            self._get_memory_info = get_memory_info
+            self._get_network_info = get_network_info
+            self._get_disk_info = get_disk_info
+            self._static_info = None
+            self._module_mtime = self._source_mtime(sys.modules['common.system_info'])
             
         except Exception as e:
             logger.error(f"Failed to load/reload system_info module: {e}")
-            self._system_info_module = None
+            self._get_system_info = None
+            self._get_system_summary = None
             raise
     
     def _is_cache_valid(self, cache_key: str) -> bool:
         """Check if cached data is still valid"""
-        if cache_key not in self._collection_cache:
-            return False
-        
-        cache_entry = self._collection_cache[cache_key]
-        cache_time = cache_entry.get('timestamp')
-        if not cache_time:
-            return False
-        
-        time_diff = (datetime.now() - cache_time).total_seconds()
-        return time_diff < self._cache_duration
+        return self._get_cached_result(cache_key) is not None
     
     def _cache_result(self, cache_key: str, data: Dict[str, Any]):
         """Cache collection result"""
         self._collection_cache[cache_key] = {
             'data': data,
-            'timestamp': datetime.now()
+            'timestamp': time.monotonic()
         }
     
     def _get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Get cached result if valid"""
-        if self._is_cache_valid(cache_key):
-            return self._collection_cache[cache_key]['data']
+        # One lookup per cache hit; entries are stamped in monotonic seconds,
+        # which are unaffected by clock changes
+        cache_entry = self._collection_cache.get(cache_key)
+        if cache_entry is not None and time.monotonic() - cache_entry['timestamp'] < self._cache_duration:
+            return cache_entry['data']
         return None
     
     def collect_fresh_system_info(self, force_reload: bool = False) -> Dict[str, Any]:
@@ -106,22 +163,34 @@ class ClientInfoCollector:
         
         try:
             # Ensure we have the latest system_info module
-            if force_reload or not self._system_info_module:
+            if force_reload or self._get_system_info is None:
                 self._ensure_system_info_module()
             
-            if not self._system_info_module:
+            if self._get_system_info is None:
                 raise Exception("System info module not available")
             
-            # Collect fresh information
-            get_system_info = self._system_info_module['get_system_info']
-            get_system_summary = self._system_info_module['get_system_summary']
-            
-            system_info = get_system_info()
-            system_summary = get_system_summary()
+            # Collect fresh information, probing only the volatile parts while
+            # the static parts are recent enough
+            static_info = self._static_info
+            if (not force_reload and static_info is not None and
+                    time.monotonic() - self._static_info_time < self._static_info_duration):
+                system_info = {
+                    **static_info,
+                    'memory': self._get_memory_info(),
+                    'network': self._get_network_info(),
+                    'disk': self._get_disk_info()
+                }
+            else:
+                system_info = self._get_system_info()
+                self._static_info = system_info
+                self._static_info_time = time.monotonic()
+            system_summary = self._get_system_summary(system_info)
             
             result = {
                 'system_info': system_info,
                 'system_summary': system_summary,
+                # Client record fields, built once per collection for all prepare_* callers
+                'client_fields': _client_info_fields(system_info),
                 'collection_timestamp': datetime.now().isoformat(),
                 'collection_source': 'fresh_collection'
             }
@@ -135,21 +204,17 @@ class ClientInfoCollector:
         except Exception as e:
             logger.error(f"Failed to collect fresh system information: {e}")
             # Return minimal fallback information
+            error_msg = str(e)
+            now_iso = datetime.now().isoformat()
+            system_info = {
+                'error': error_msg,
+                'timestamp': now_iso
+            }
             return {
-                'system_info': {
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                },
-                'system_summary': {
-                    'error': str(e),
-                    'cpu': 'Unknown',
-                    'memory': 'Unknown',
-                    'gpu': 'Unknown',
-                    'os': 'Unknown',
-                    'hostname': 'unknown',
-                    'ip': '127.0.0.1'
-                },
-                'collection_timestamp': datetime.now().isoformat(),
+                'system_info': system_info,
+                'system_summary': {'error': error_msg, **_UNKNOWN_SYSTEM_SUMMARY},
+                'client_fields': _client_info_fields(system_info),
+                'collection_timestamp': now_iso,
                 'collection_source': 'error_fallback'
             }
     
@@ -170,7 +235,6 @@ class ClientInfoCollector:
         try:
             # Collect fresh system information
             info_result = self.collect_fresh_system_info(force_reload=True)
-            system_info = info_result['system_info']
             system_summary = info_result['system_summary']
             
             registration_data = {
@@ -179,11 +243,7 @@ class ClientInfoCollector:
                 'port': port,
                 'status': 'online',
                 # Fresh system information
-                'cpu_info': system_info.get('cpu'),
-                'memory_info': system_info.get('memory'),
-                'gpu_info': system_info.get('gpu'),
-                'os_info': system_info.get('os'),
-                'disk_info': system_info.get('disk'),
+                **info_result['client_fields'],
                 'system_summary': system_summary,
                 # Metadata
                 'collection_timestamp': info_result['collection_timestamp'],
@@ -213,7 +273,6 @@ class ClientInfoCollector:
         try:
             # Collect fresh system information (allow short-term caching for heartbeats)
             info_result = self.collect_fresh_system_info(force_reload=False)
-            system_info = info_result['system_info']
             system_summary = info_result['system_summary']
             
             heartbeat_data = {
@@ -221,11 +280,7 @@ class ClientInfoCollector:
                 'status': status,
                 'timestamp': datetime.now().isoformat(),
                 # Fresh system information
-                'cpu_info': system_info.get('cpu'),
-                'memory_info': system_info.get('memory'),
-                'gpu_info': system_info.get('gpu'),
-                'os_info': system_info.get('os'),
-                'disk_info': system_info.get('disk'),
+                **info_result['client_fields'],
                 'system_summary': system_summary,
                 # Metadata
                 'collection_timestamp': info_result['collection_timestamp'],
@@ -262,7 +317,6 @@ class ClientInfoCollector:
         try:
             # Collect fresh system information for ping responses
             info_result = self.collect_fresh_system_info(force_reload=True)
-            system_info = info_result['system_info']
             system_summary = info_result['system_summary']
             
             ping_data = {
@@ -270,11 +324,7 @@ class ClientInfoCollector:
                 'status': 'online',
                 'response_timestamp': datetime.now().isoformat(),
                 # Fresh system information
-                'cpu_info': system_info.get('cpu'),
-                'memory_info': system_info.get('memory'),
-                'gpu_info': system_info.get('gpu'),
-                'os_info': system_info.get('os'),
-                'disk_info': system_info.get('disk'),
+                **info_result['client_fields'],
                 'system_summary': system_summary,
                 # Metadata
                 'collection_timestamp': info_result['collection_timestamp'],
@@ -307,7 +357,7 @@ class ClientInfoCollector:
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get statistics about information collection"""
         return {
-            'module_loaded': self._system_info_module is not None,
+            'module_loaded': self._get_system_info is not None,
             'last_reload_time': self._last_reload_time.isoformat() if self._last_reload_time else None,
             'cache_entries': len(self._collection_cache),
             'cache_duration': self._cache_duration
@@ -321,7 +371,7 @@ class ClientInfoCollector:
     def force_module_reload(self):
         """Force reload of system info module"""
         try:
-            self._ensure_system_info_module()
+            self._ensure_system_info_module(force=True)
             self.clear_cache()
             logger.info("System info module forcibly reloaded")
         except Exception as e:
@@ -329,32 +379,26 @@ class ClientInfoCollector:
             raise
 
 
-# Global instance for shared use
-_client_info_collector = None
+# Global instance for shared use; construction does no I/O, so it is built
+# at import rather than lazily (which could race between threads)
+_client_info_collector = ClientInfoCollector()
 
 def get_client_info_collector() -> ClientInfoCollector:
     """Get the global client info collector instance"""
-    global _client_info_collector
-    if _client_info_collector is None:
-        _client_info_collector = ClientInfoCollector()
     return _client_info_collector
 
 def collect_fresh_system_info(force_reload: bool = False) -> Dict[str, Any]:
     """Convenience function to collect fresh system information"""
-    collector = get_client_info_collector()
-    return collector.collect_fresh_system_info(force_reload=force_reload)
+    return _client_info_collector.collect_fresh_system_info(force_reload=force_reload)
 
 def prepare_registration_data(client_name: str, ip_address: str, port: int = 8080) -> Dict[str, Any]:
     """Convenience function to prepare registration data"""
-    collector = get_client_info_collector()
-    return collector.prepare_registration_data(client_name, ip_address, port)
+    return _client_info_collector.prepare_registration_data(client_name, ip_address, port)
 
 def prepare_heartbeat_data(client_name: str, status: str = 'online') -> Dict[str, Any]:
     """Convenience function to prepare heartbeat data"""
-    collector = get_client_info_collector()
-    return collector.prepare_heartbeat_data(client_name, status)
+    return _client_info_collector.prepare_heartbeat_data(client_name, status)
 
 def prepare_ping_response_data(client_name: str, additional_data: Dict[str, Any] = None) -> Dict[str, Any]:
     """Convenience function to prepare ping response data"""
-    collector = get_client_info_collector()
-    return collector.prepare_ping_response_data(client_name, additional_data)
+    return _client_info_collector.prepare_ping_response_data(client_name, additional_data)
@@ -38,11 +38,13 @@ class Config:
     @classmethod
     def to_dict(cls) -> Dict[str, Any]:
         """Return configuration dictionary"""
-        config = {}
-        for attr_name in dir(cls):
-            if not attr_name.startswith('_') and not callable(getattr(cls, attr_name)):
-                config[attr_name] = getattr(cls, attr_name)
-        return config
+        return {attr_name: getattr(cls, attr_name) for attr_name in cls._CONFIG_KEYS}
+
+# Public configuration attribute names, collected once (sorted, as dir() returns them)
+Config._CONFIG_KEYS = tuple(sorted(
+    attr_name for attr_name in vars(Config)
+    if not attr_name.startswith('_') and not callable(getattr(Config, attr_name))
+))
 
 class ClientConfig:
     # Server connection configuration
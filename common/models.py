@@ -7,11 +7,15 @@ Naming convention:
   - Run:            One instance of a job executing on a specific device
   - TaskDefinition: Parameters for a task within a job (name, client, kwargs, …)
 """
+import sys
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class JobStatus(Enum):
     PENDING = "pending"
@@ -27,7 +31,12 @@ class ClientStatus(Enum):
     BUSY = "busy"
 
 
-@dataclass
+# Status -> serialized value, for to_dict (a dict lookup instead of Enum.value)
+_JOB_STATUS_VALUES = {status: status.value for status in JobStatus}
+_CLIENT_STATUS_VALUES = {status: status.value for status in ClientStatus}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TaskDefinition:
     """Parameters for a task within a job"""
     name: str = ""
@@ -60,7 +69,7 @@ class TaskDefinition:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Job:
     id: Optional[int] = None
     name: str = ""
@@ -113,20 +122,18 @@ class Job:
             self.execution_order = [1]
 
     def get_all_clients(self) -> List[str]:
-        """Get all unique clients from tasks and legacy fields"""
-        clients = set()
-
-        # Add from legacy clients
-        clients.update(self.clients or [])
+        """Get all unique clients from tasks and legacy fields, in first-seen order"""
+        # Dict keys de-duplicate while keeping a deterministic order
+        clients = dict.fromkeys(self.clients or [])
 
         # Add from tasks
         for task in self.tasks or []:
             if task.client:
-                clients.add(task.client)
+                clients[task.client] = None
 
         # Add legacy client
         if self.client:
-            clients.add(self.client)
+            clients[self.client] = None
 
         return list(clients)
 
@@ -135,12 +142,18 @@ class Job:
         return [task for task in (self.tasks or [])
                 if task.client == client_name]
 
+    def get_tasks_by_client(self) -> Dict[str, List[TaskDefinition]]:
+        """Group tasks by client in a single pass, in task order"""
+        tasks_by_client = {}
+        for task in self.tasks or []:
+            tasks_by_client.setdefault(task.client, []).append(task)
+        return tasks_by_client
+
     def get_email_recipients_list(self) -> List[str]:
         """Get email recipients as a list, parsing semicolon-separated string"""
         if not self.email_recipients:
             return []
-        recipients = [email.strip() for email in self.email_recipients.split(';')]
-        return [email for email in recipients if email]
+        return [email for email in map(str.strip, self.email_recipients.split(';')) if email]
 
     def should_send_email(self) -> bool:
         """Check if email notifications should be sent for this job"""
@@ -158,7 +171,7 @@ class Job:
             'commands': self.commands,
             'execution_order': self.execution_order,
             'tasks': [task.to_dict() for task in (self.tasks or [])],
-            'status': self.status.value,
+            'status': _JOB_STATUS_VALUES[self.status],
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'started_at': self.started_at.isoformat() if self.started_at else None,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
@@ -171,7 +184,7 @@ class Job:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Client:
     name: str
     ip_address: str
@@ -211,7 +224,7 @@ class Client:
             'name': self.name,
             'ip_address': self.ip_address,
             'port': self.port,
-            'status': self.status.value,
+            'status': _CLIENT_STATUS_VALUES[self.status],
             'last_heartbeat': self.last_heartbeat.isoformat() if self.last_heartbeat else None,
             'last_config_update': self.last_config_update.isoformat() if self.last_config_update else None,
             'current_job_id': self.current_job_id,
@@ -225,7 +238,7 @@ class Client:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Run:
     """Represents a single run of a task on a specific client within a job"""
     id: Optional[int] = None
@@ -251,7 +264,7 @@ class Run:
             'client': self.client,
             'started_at': self.started_at.isoformat() if self.started_at else None,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-            'status': self.status.value,
+            'status': _JOB_STATUS_VALUES[self.status],
             'result': self.result,
             'error_message': self.error_message,
             'execution_time': self.execution_time
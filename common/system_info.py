@@ -765,10 +765,15 @@ def format_bytes(bytes_value: int) -> str:
     return f"{bytes_value:.1f} {units[i]}"
 
 
-def get_system_summary() -> Dict[str, str]:
-    """Get a summary of system information for display"""
+def get_system_summary(system_info: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """Get a summary of system information for display
+
+    Args:
+        system_info: Result of get_system_info() to summarize; collected if omitted
+    """
     try:
-        system_info = get_system_info()
+        if system_info is None:
+            system_info = get_system_info()
         
         # CPU summary
         cpu = system_info['cpu']
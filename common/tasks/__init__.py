@@ -22,20 +22,29 @@ import sys
 import importlib
 import importlib.util
 import logging
+import threading
 from typing import Dict, Any, Optional, List
 
 from .base import BaseTask, TaskRegistry, TaskResultDefinition
 
 # Global registry instance
 _registry = None
+_registry_ready = False
+_registry_lock = threading.RLock()
 
 
 def get_registry() -> TaskRegistry:
     """Get the global task registry"""
-    global _registry
-    if _registry is None:
-        _registry = TaskRegistry()
-        _load_all_tasks()
+    global _registry, _registry_ready
+    if not _registry_ready:
+        # Task modules register themselves through get_registry() while
+        # loading, hence the re-entrant lock; other threads wait until
+        # every module has loaded.
+        with _registry_lock:
+            if _registry is None:
+                _registry = TaskRegistry()
+                _load_all_tasks()
+                _registry_ready = True
     return _registry
 
 
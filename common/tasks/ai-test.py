@@ -165,6 +165,9 @@ class AiTestTask(BaseTask):
         extra_args:       List of additional CLI arguments
     """
 
+    # GPU benchmarks skew each other when run concurrently
+    parallel_safe = False
+
     def run(self, *args, **kwargs) -> Dict[str, Any]:
         output: Dict[str, Any] = {
             'ai_test_path': None,
@@ -14,6 +14,11 @@ from abc import ABC, abstractmethod
 class BaseTask(ABC):
     """Base class for all task types"""
 
+    # Tasks without side effects that could clash with other tasks of the
+    # same order (shared files, exclusive devices) set this to run alongside
+    # them; everything else runs one at a time
+    parallel_safe = False
+
     @abstractmethod
     def run(self, *args, **kwargs) -> Any:
         """Execute the task and return the result"""
@@ -42,30 +47,37 @@ class BaseTask(ABC):
             result = self.run(*args, **kwargs)
             end_time = datetime.now()
 
+            # Built from locals: the instance is shared by every execution of
+            # this task type, and parallel_safe tasks can run concurrently
+            execution_time = (end_time - start_time).total_seconds()
+            timestamp = start_time.isoformat()
+
             self._last_result = result
             self._last_error = None
-            self._last_execution_time = (end_time - start_time).total_seconds()
-            self._last_timestamp = start_time.isoformat()
+            self._last_execution_time = execution_time
+            self._last_timestamp = timestamp
 
             return {
                 'success': True,
                 'error': None,
                 'result': result,
-                'execution_time': self._last_execution_time,
-                'timestamp': self._last_timestamp
+                'execution_time': execution_time,
+                'timestamp': timestamp
             }
         except Exception as e:
+            timestamp = datetime.now().isoformat()
+
             self._last_result = None
             self._last_error = str(e)
             self._last_execution_time = None
-            self._last_timestamp = datetime.now().isoformat()
+            self._last_timestamp = timestamp
 
             logging.error(f"Task '{self.__class__.__name__}' execution failed: {e}")
             return {
                 'success': False,
                 'error': str(e),
                 'result': None,
-                'timestamp': self._last_timestamp
+                'timestamp': timestamp
             }
 
 
@@ -25,6 +25,9 @@ from . import register_task_class
 class DawnE2ETestsTask(BaseTask):
     """Dawn E2E tests task for downloading and running Dawn end-to-end tests."""
 
+    # Extracts into a shared backup folder and needs the GPU to itself
+    parallel_safe = False
+
     def run(self, *args, **kwargs) -> Dict[str, Any]:
         """
         Download and run Dawn E2E tests.
@@ -18,6 +18,9 @@ from . import register_task_class
 class GetHostnameTask(BaseTask):
     """Task to get the hostname of the current client"""
 
+    # Only reads system state
+    parallel_safe = True
+
     def run(self, *args, **kwargs) -> str:
         """
         Get the hostname of the current client.
@@ -4,6 +4,7 @@ Utility functions
 import logging
 import json
 import socket
+import platform
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -35,18 +36,41 @@ def setup_logging(log_level: str = 'INFO', log_file: Optional[str] = None):
         force=True
     )
 
+# Local IP discovered by get_local_ip; stable for the process lifetime
+_LOCAL_IP: Optional[str] = None
+
 def get_local_ip() -> str:
-    """Get local IP address"""
+    """Get local IP address (cached after the first successful lookup)"""
+    global _LOCAL_IP
+    if _LOCAL_IP is not None:
+        return _LOCAL_IP
+
+    # Resolve our own hostname first: a local lookup that emits no packets
+    ip = None
     try:
-        # Connect to a non-existent address to get local IP
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
-    except Exception:
+        infos = socket.getaddrinfo(platform.node(), None, socket.AF_INET)
+        ip = next((ai[4][0] for ai in infos if not ai[4][0].startswith('127.')), None)
+    except (socket.gaierror, UnicodeError):
+        pass
+
+    if not ip:
+        try:
+            # Connect a UDP socket to a public address to find the routed interface
+            # (connect() on UDP sends nothing; the timeout guards slow stacks)
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.settimeout(0.25)
+                s.connect(("8.8.8.8", 80))
+                ip = s.getsockname()[0]
+        except Exception:
+            pass
+
+    if not ip:
+        # Don't cache the loopback fallback; the network may come up later
         return "127.0.0.1"
 
+    _LOCAL_IP = ip
+    return ip
+
 def format_datetime(dt: Optional[datetime]) -> Optional[str]:
     """Format datetime"""
     if dt is None:
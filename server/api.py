@@ -539,170 +539,214 @@ def create_api_blueprint(database, socketio, result_collector=None):
             logger.error(f"Get Task run records by client failed: {e}")
             return jsonify({'success': False, 'error': str(e)}), 500
 
-    @api.route('/jobs/<int:task_id>/runs', methods=['POST'])
-    def update_run(task_id):
-        """Update Task run status (called by client)"""
-        try:
-            data = request.get_json()
-
-            # Enhanced logging for Task run status
-            task_name = data.get('task_name')
-            client = data.get('client')
-            status = data.get('status')
-            execution_time = data.get('execution_time')
-            result = data.get('result')
-            error_message = data.get('error_message')
-
-            # Enhanced logging for Task result reception
-            logger.info(f"📨 RESULT_RECEIVED: Task {task_id} - '{task_name}' from client '{client}' - Status: {status}")
-            if execution_time:
-                logger.info(f"RESULT_TIMING: Task {task_id} - '{task_name}' executed in {execution_time:.2f}s on '{client}'")
-
-            # Log result details based on status
-            if status == 'completed' and result:
-                result_preview = str(result)[:100] + "..." if len(str(result)) > 100 else str(result)
-                logger.info(f"RESULT_SUCCESS: Task {task_id} - '{task_name}' → Result: {result_preview}")
-            elif status == 'failed' and error_message:
-                error_preview = str(error_message)[:100] + "..." if len(str(error_message)) > 100 else str(error_message)
-                logger.info(f"RESULT_ERROR: Task {task_id} - '{task_name}' → Error: {error_preview}")
-
-            logger.info(f"TASK_EXECUTION: Task {task_id} - '{task_name}' on '{client}' - Status: {status}")
-            if execution_time:
-                logger.info(f"TASK_EXECUTION: Task {task_id} - '{task_name}' run time: {execution_time}s")
-            if result:
-                logger.debug(f"TASK_EXECUTION: Task {task_id} - '{task_name}' result: {result[:200]}{'...' if len(str(result)) > 200 else ''}")
-            if error_message:
-                logger.warning(f"TASK_EXECUTION: Task {task_id} - '{task_name}' error: {error_message}")
+    def _apply_run_update(task_id, data):
+        """Apply a single Task run status report and return the updated run"""
+        # Clients may send the result as a native JSON value; runs store text
+        if data.get('result') is not None and not isinstance(data['result'], str):
+            data['result'] = json.dumps(data['result'], ensure_ascii=False, separators=(',', ':'), default=str)
+
+        # Enhanced logging for Task run status
+        task_name = data.get('task_name')
+        client = data.get('client')
+        status = data.get('status')
+        execution_time = data.get('execution_time')
+        result = data.get('result')
+        error_message = data.get('error_message')
+
+        # Enhanced logging for Task result reception
+        logger.info(f"📨 RESULT_RECEIVED: Task {task_id} - '{task_name}' from client '{client}' - Status: {status}")
+        if execution_time:
+            logger.info(f"RESULT_TIMING: Task {task_id} - '{task_name}' executed in {execution_time:.2f}s on '{client}'")
+
+        # Log result details based on status
+        if status == 'completed' and result:
+            result_preview = str(result)[:100] + "..." if len(str(result)) > 100 else str(result)
+            logger.info(f"RESULT_SUCCESS: Task {task_id} - '{task_name}' → Result: {result_preview}")
+        elif status == 'failed' and error_message:
+            error_preview = str(error_message)[:100] + "..." if len(str(error_message)) > 100 else str(error_message)
+            logger.info(f"RESULT_ERROR: Task {task_id} - '{task_name}' → Error: {error_preview}")
+
+        logger.info(f"TASK_EXECUTION: Task {task_id} - '{task_name}' on '{client}' - Status: {status}")
+        if execution_time:
+            logger.info(f"TASK_EXECUTION: Task {task_id} - '{task_name}' run time: {execution_time}s")
+        if result:
+            logger.debug(f"TASK_EXECUTION: Task {task_id} - '{task_name}' result: {result[:200]}{'...' if len(str(result)) > 200 else ''}")
+        if error_message:
+            logger.warning(f"TASK_EXECUTION: Task {task_id} - '{task_name}' error: {error_message}")
+
+        # Validate required fields
+        required_fields = ['task_name', 'client', 'status']
+        for field in required_fields:
+            if field not in data:
+                raise ValueError(f'Missing required field: {field}')
+
+        # Find or create run record
+        runs = database.get_runs_by_client(task_id, data['client'])
+        run = None
+
+        for r in runs:
+            if r.task_name == data['task_name'] and r.status in [JobStatus.PENDING, JobStatus.RUNNING]:
+                run = r
+                break
+
+        if not run:
+            # Create new run record
+            from common.models import Run
+
+            # Find the task definition to get the task_id
+            task = database.get_job(task_id)
+            run_task_id = None
+            if task and task.tasks:
+                for task_def in task.tasks:
+                    if (task_def.name == data['task_name'] and
+                        task_def.client == data['client']):
+                        run_task_id = task_def.task_id
+                        break
+
+            run = Run(
+                job_id=task_id,
+                task_id=run_task_id or f"{data.get('order', 0)}_{data['task_name']}",
+                task_name=data['task_name'],
+                task_order=data.get('order', 0),
+                client=data['client'],
+                status=JobStatus(data['status'])
+            )
+            run.id = database.create_run(run)
+            logger.info(f"Created run record for job {task_id} - '{task_name}' on '{client}'")
 
-            # Validate required fields
-            required_fields = ['task_name', 'client', 'status']
-            for field in required_fields:
-                if field not in data:
-                    return jsonify({
-                        'success': False,
-                        'error': f'Missing required field: {field}'
-                    }), 400
+        # Update run status
+        run.status = JobStatus(data['status'])
+        run.result = data.get('result')
+        run.error_message = data.get('error_message')
+        run.execution_time = data.get('execution_time')
 
-            # Find or create run record
-            runs = database.get_runs_by_client(task_id, data['client'])
-            run = None
+        if data['status'] in ['completed', 'failed']:
+            run.completed_at = datetime.now()
 
-            for r in runs:
-                if r.task_name == data['task_name'] and r.status in [JobStatus.PENDING, JobStatus.RUNNING]:
-                    run = r
-                    break
+        database.update_run(run)
 
-            if not run:
-                # Create new run record
-                from common.models import Run
-
-                # Find the task definition to get the task_id
-                task = database.get_job(task_id)
-                run_task_id = None
-                if task and task.tasks:
-                    for task_def in task.tasks:
-                        if (task_def.name == data['task_name'] and
-                            task_def.client == data['client']):
-                            run_task_id = task_def.task_id
-                            break
-
-                run = Run(
-                    job_id=task_id,
-                    task_id=run_task_id or f"{data.get('order', 0)}_{data['task_name']}",
-                    task_name=data['task_name'],
-                    task_order=data.get('order', 0),
-                    client=data['client'],
-                    status=JobStatus(data['status'])
-                )
-                run.id = database.create_run(run)
-                logger.info(f"Created run record for job {task_id} - '{task_name}' on '{client}'")
-
-            # Update run status
-            run.status = JobStatus(data['status'])
-            run.result = data.get('result')
-            run.error_message = data.get('error_message')
-            run.execution_time = data.get('execution_time')
-
-            if data['status'] in ['completed', 'failed']:
-                run.completed_at = datetime.now()
-
-            database.update_run(run)
-
-            # Update client's current task status
-            if data['status'] == 'running':
-                task = database.get_job(task_id)
-                if task and task.tasks:
-                    for task_def in task.tasks:
-                        if (task_def.name == data['task_name'] and
-                            task_def.client == data['client']):
-                            database.update_client_current_task(
-                                data['client'],
-                                task_id,
-                                task_def.task_id
-                            )
-                            break
-            elif data['status'] in ['completed', 'failed']:
-                task = database.get_job(task_id)
-                if task and task.tasks:
-                    remaining = [
-                        t for t in task.tasks
-                        if (t.client == data['client'] and
-                            t.order > data.get('order', 0))
-                    ]
-                    if remaining:
-                        next_td = min(remaining, key=lambda x: x.order)
+        # Update client's current task status
+        if data['status'] == 'running':
+            task = database.get_job(task_id)
+            if task and task.tasks:
+                for task_def in task.tasks:
+                    if (task_def.name == data['task_name'] and
+                        task_def.client == data['client']):
                         database.update_client_current_task(
                             data['client'],
                             task_id,
-                            next_td.task_id
+                            task_def.task_id
                         )
-                    else:
-                        # No more tasks, clear current task
-                        database.update_client_current_task(data['client'], None, None)
-                        # Set client back to online
-                        database.update_client_heartbeat_by_name(data['client'], ClientStatus.ONLINE)
-
-            # Check if all tasks are completed and update overall task status
-            logger.debug(f"TASK_EXECUTION: Checking task completion for task {task_id}")
-
-            # Notify result collector about Task completion
-            if result_collector and data['status'] in ['completed', 'failed']:
-                result_collector.on_run_completion(
-                    job_id=task_id,
-                    client_name=data['client'],
-                    task_name=data['task_name'],
-                    task_status=JobStatus(data['status']),
-                    result=data.get('result'),
-                    error_message=data.get('error_message'),
-                    execution_time=data.get('execution_time')
-                )
-            else:
-                # Fallback to original completion check
-                check_and_update_task_completion(task_id)
-
-            logger.info(f"DEBUG: Finished processing Task completion for task {task_id}")
+                        break
+        elif data['status'] in ['completed', 'failed']:
+            task = database.get_job(task_id)
+            if task and task.tasks:
+                remaining = [
+                    t for t in task.tasks
+                    if (t.client == data['client'] and
+                        t.order > data.get('order', 0))
+                ]
+                if remaining:
+                    next_td = min(remaining, key=lambda x: x.order)
+                    database.update_client_current_task(
+                        data['client'],
+                        task_id,
+                        next_td.task_id
+                    )
+                else:
+                    # No more tasks, clear current task
+                    database.update_client_current_task(data['client'], None, None)
+                    # Set client back to online
+                    database.update_client_heartbeat_by_name(data['client'], ClientStatus.ONLINE)
+
+        # Check if all tasks are completed and update overall task status
+        logger.debug(f"TASK_EXECUTION: Checking task completion for task {task_id}")
+
+        # Notify result collector about Task completion
+        if result_collector and data['status'] in ['completed', 'failed']:
+            result_collector.on_run_completion(
+                job_id=task_id,
+                client_name=data['client'],
+                task_name=data['task_name'],
+                task_status=JobStatus(data['status']),
+                result=data.get('result'),
+                error_message=data.get('error_message'),
+                execution_time=data.get('execution_time')
+            )
+        else:
+            # Fallback to original completion check
+            check_and_update_task_completion(task_id)
+
+        logger.info(f"DEBUG: Finished processing Task completion for task {task_id}")
+
+        # Broadcast task run status update
+        socketio.emit('subtask_updated', {
+            'task_id': task_id,
+            'run_task_id': run.task_id,
+            'task_name': data['task_name'],
+            'client': data['client'],
+            'status': data['status'],
+            'result': data.get('result'),
+            'error_message': data.get('error_message'),
+            'execution_time': data.get('execution_time')
+        })
+
+        return run
 
-            # Broadcast task run status update
-            socketio.emit('subtask_updated', {
-                'task_id': task_id,
-                'run_task_id': run.task_id,
-                'task_name': data['task_name'],
-                'client': data['client'],
-                'status': data['status'],
-                'result': data.get('result'),
-                'error_message': data.get('error_message'),
-                'execution_time': data.get('execution_time')
-            })
+    @api.route('/jobs/<int:task_id>/runs', methods=['POST'])
+    def update_run(task_id):
+        """Update Task run status (called by client)"""
+        try:
+            run = _apply_run_update(task_id, request.get_json())
 
             return jsonify({
                 'success': True,
                 'data': run.to_dict()
             })
 
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         except Exception as e:
             logger.error(f"Update Task run failed: {e}")
             return jsonify({'success': False, 'error': str(e)}), 500
 
+    @api.route('/jobs/<int:task_id>/runs/batch', methods=['POST'])
+    def update_runs_batch(task_id):
+        """Apply several Task run status reports in order (called by client)
+
+        Each report is applied on its own, so one bad report does not drop the
+        rest of the batch; failed reports are listed in 'errors' by index.
+        """
+        try:
+            body = request.get_json()
+            if not isinstance(body, dict):
+                return jsonify({'success': False, 'error': 'Request body must be an object'}), 400
+
+            reports = body.get('reports', [])
+            if not isinstance(reports, list):
+                return jsonify({'success': False, 'error': 'reports must be a list'}), 400
+
+            runs = []
+            errors = []
+            for index, data in enumerate(reports):
+                try:
+                    if not isinstance(data, dict):
+                        raise ValueError('Report must be an object')
+                    runs.append(_apply_run_update(task_id, data).to_dict())
+                except Exception as e:
+                    logger.error(f"Batch update Task run {index} for job {task_id} failed: {e}")
+                    errors.append({'index': index, 'error': str(e)})
+
+            return jsonify({
+                'success': not errors,
+                'data': runs,
+                'errors': errors
+            })
+
+        except Exception as e:
+            logger.error(f"Batch update Task runs failed: {e}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+
     # Task Types API
     @api.route('/tasks', methods=['GET'])
     def get_available_tasks():
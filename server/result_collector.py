@@ -129,8 +129,9 @@ class TaskResultCollector:
 
                 # Check completion status for each client
                 all_completed = True
+                tasks_by_client = job.get_tasks_by_client()
                 for client_name in clients:
-                    client_tasks = job.get_tasks_for_client(client_name)
+                    client_tasks = tasks_by_client.get(client_name, [])
                     if not client_tasks:
                         continue  # No tasks for this client
 
@@ -268,9 +269,10 @@ class TaskResultCollector:
 
         try:
             clients = job.get_all_clients()
+            tasks_by_client = job.get_tasks_by_client()
 
             for client_name in clients:
-                client_tasks = job.get_tasks_for_client(client_name)
+                client_tasks = tasks_by_client.get(client_name, [])
 
                 if not client_tasks:
                     continue
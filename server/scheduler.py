@@ -202,9 +202,10 @@ class TaskScheduler:
             self.database.update_job(task)
 
             # Dispatch to each client
+            tasks_by_client = task.get_tasks_by_client()
             for client_name, client in available_clients.items():
                 # Get tasks for this client
-                client_tasks = task.get_tasks_for_client(client_name)
+                client_tasks = tasks_by_client.get(client_name, [])
 
                 if client_tasks:
                     # Update client status
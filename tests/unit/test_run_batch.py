@@ -0,0 +1,79 @@
+"""
+Tests for the batched Task run status endpoint (POST /api/jobs/<id>/runs/batch)
+"""
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+flask = pytest.importorskip('flask')
+pytest.importorskip('flask_socketio')
+
+from common.models import Job, TaskDefinition
+from server.api import create_api_blueprint
+from server.database import Database
+
+
+@pytest.fixture
+def api_env(tmp_path):
+    database = Database(str(tmp_path / 'server.db'))
+    app = flask.Flask(__name__)
+    app.register_blueprint(create_api_blueprint(database, mock.MagicMock()), url_prefix='/api')
+
+    job_id = database.create_job(Job(
+        name='batch-job',
+        tasks=[
+            TaskDefinition(name='first', client='client-a', order=1, task_id=1),
+            TaskDefinition(name='second', client='client-a', order=2, task_id=2),
+        ]
+    ))
+    return app.test_client(), database, job_id
+
+
+def test_malformed_report_does_not_drop_rest_of_batch(api_env):
+    client, database, job_id = api_env
+    reports = [
+        {'task_name': 'first', 'client': 'client-a', 'order': 1, 'status': 'completed', 'result': 'ok'},
+        {'task_name': 'broken', 'client': 'client-a', 'order': 1},  # missing status
+        {'task_name': 'second', 'client': 'client-a', 'order': 2, 'status': 'failed', 'error_message': 'boom'},
+    ]
+
+    response = client.post(f'/api/jobs/{job_id}/runs/batch', json={'reports': reports})
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['success'] is False
+    assert [error['index'] for error in body['errors']] == [1]
+    assert len(body['data']) == 2
+
+    statuses = {run.task_name: run.status.value for run in database.get_runs_by_client(job_id, 'client-a')}
+    assert statuses == {'first': 'completed', 'second': 'failed'}
+
+
+def test_batch_without_errors_succeeds(api_env):
+    client, database, job_id = api_env
+    reports = [{'task_name': 'first', 'client': 'client-a', 'order': 1, 'status': 'running'}]
+
+    response = client.post(f'/api/jobs/{job_id}/runs/batch', json={'reports': reports})
+
+    body = response.get_json()
+    assert body['success'] is True
+    assert body['errors'] == []
+    assert database.get_runs_by_client(job_id, 'client-a')[0].status.value == 'running'
+
+
+@pytest.mark.parametrize('body', [
+    [{'task_name': 'first', 'client': 'client-a', 'order': 1, 'status': 'running'}],
+    'reports',
+])
+def test_non_object_body_is_rejected(api_env, body):
+    client, database, job_id = api_env
+
+    response = client.post(f'/api/jobs/{job_id}/runs/batch', json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+    assert database.get_runs_by_client(job_id, 'client-a') == []
@@ -0,0 +1,188 @@
+"""
+Tests for client-side Task status reporting (client/task_executor.py)
+"""
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'client'))
+
+requests = pytest.importorskip('requests')
+pytest.importorskip('urllib3')
+
+import task_executor
+from common.models import JobStatus, TaskDefinition
+
+
+def mock_session(body=None, status_code=200):
+    """Session whose posts all get the same JSON response"""
+    session = mock.create_autospec(requests.Session, instance=True)
+    response = session.post.return_value
+    response.status_code = status_code
+    response.json.return_value = body if body is not None else {'success': True, 'errors': []}
+    return session
+
+
+@pytest.fixture
+def adapter(tmp_path, monkeypatch):
+    monkeypatch.setattr(task_executor, '_LOGS_DIR', str(tmp_path))
+    adapter = task_executor.TaskAdapter('http://server', 'client-a')
+    adapter.executor._session = mock_session()
+    yield adapter
+    adapter.close()
+
+
+@pytest.fixture
+def executor(adapter):
+    return adapter.executor
+
+
+def sent_reports(executor):
+    return [report
+            for call in executor._session.post.call_args_list
+            for report in json.loads(call.kwargs['data'])['reports']]
+
+
+def test_running_report_with_null_timeout_is_sent(executor):
+    task = TaskDefinition(name='get_hostname', client='client-a', order=1, timeout=None)
+
+    executor._report_task_status(7, task, JobStatus.RUNNING)
+    executor._flush_reports()
+
+    assert [report['status'] for report in sent_reports(executor)] == ['running']
+
+
+def test_job_with_null_timeout_reports_final_status(adapter, executor):
+    tasks_data = [{'name': 'get_hostname', 'client': 'client-a', 'order': 1, 'timeout': None}]
+
+    result = adapter._execute_task_job(7, 'null-timeout', tasks_data)
+
+    assert result['success'] is True
+    assert sent_reports(executor)[-1]['status'] == 'completed'
+
+
+def test_rejected_reports_are_logged(executor, caplog):
+    executor._session = mock_session({
+        'success': False,
+        'data': [],
+        'errors': [{'index': 1, 'error': 'Missing required field: status'}]
+    })
+    task = TaskDefinition(name='get_hostname', client='client-a', order=1)
+    executor._report_task_status(7, task, JobStatus.COMPLETED, result='a')
+    executor._report_task_status(7, TaskDefinition(name='other', client='client-a', order=2),
+                                 JobStatus.FAILED, error_message='b')
+
+    executor._flush_reports()
+
+    assert len(sent_reports(executor)) == 2
+    rejected = [record for record in caplog.records if 'rejected by server' in record.getMessage()]
+    assert len(rejected) == 1
+    assert "'other'" in rejected[0].getMessage()
+
+
+def test_concurrent_jobs_keep_their_own_execution_log(executor):
+    tasks = [TaskDefinition(name='get_hostname', client='client-a', order=1)]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(executor.execute_job_tasks, task_id, f'job-{task_id}', list(tasks))
+                   for task_id in (1, 2)]
+        results = [future.result() for future in futures]
+
+    for task_id, result in zip((1, 2), results):
+        assert result['success'] is True
+        with open(os.path.join(result['log_folder'], 'execution.log'), encoding='utf-8') as f:
+            log = f.read()
+        assert f"Task ID: {task_id}" in log
+        assert f"Task ID: {3 - task_id}" not in log
+        assert "=== TASK EXECUTION COMPLETED ===" in log
+
+
+def test_task_outcome_is_logged_once(executor):
+    tasks = [TaskDefinition(name='get_hostname', client='client-a', order=1),
+             TaskDefinition(name='no_such_task', client='client-a', order=2)]
+
+    result = executor.execute_job_tasks(3, 'outcomes', tasks)
+
+    with open(os.path.join(result['log_folder'], 'execution.log'), encoding='utf-8') as f:
+        log = f.read()
+    assert log.count("Task get_hostname completed successfully") == 1
+    assert log.count("Task no_such_task failed") == 1
+
+
+def test_same_order_tasks_run_in_parallel_and_keep_job_order(executor, monkeypatch):
+    run_task = executor._run_task
+    threads = {}
+
+    def slow_run_task(task_id, Task, task_logger):
+        # The first Task finishes last
+        time.sleep(Task.kwargs['delay'])
+        threads[Task.kwargs['position']] = threading.current_thread()
+        return {**run_task(task_id, Task, task_logger), 'position': Task.kwargs['position']}
+
+    monkeypatch.setattr(executor, '_run_task', slow_run_task)
+    executor.parallel_within_order = True
+    tasks = [
+        TaskDefinition(name='get_hostname', client='client-a', order=1, kwargs={'delay': 0.2, 'position': 0}),
+        TaskDefinition(name='no_such_task', client='client-a', order=1, kwargs={'delay': 0, 'position': 1}),
+        TaskDefinition(name='get_hostname', client='client-a', order=1, kwargs={'delay': 0, 'position': 2}),
+    ]
+
+    result = executor.execute_job_tasks(4, 'parallel', tasks)
+
+    assert [r['position'] for r in result['results']] == [0, 1, 2]
+    # Only the opted-in get_hostname tasks leave the job's thread
+    assert threads[1] is threading.current_thread()
+    assert threads[0] is not threading.current_thread()
+    assert threads[2] is not threading.current_thread()
+    with open(os.path.join(result['log_folder'], 'execution.log'), encoding='utf-8') as f:
+        assert "Running 2 tasks of order 1 in parallel" in f.read()
+
+
+def test_same_order_tasks_run_serially_by_default(executor, monkeypatch):
+    run_task = executor._run_task
+    threads = []
+
+    def recording_run_task(task_id, Task, task_logger):
+        threads.append(threading.current_thread())
+        return run_task(task_id, Task, task_logger)
+
+    monkeypatch.setattr(executor, '_run_task', recording_run_task)
+    tasks = [TaskDefinition(name='get_hostname', client='client-a', order=1) for _ in range(2)]
+
+    result = executor.execute_job_tasks(5, 'serial', tasks)
+
+    assert result['executed_count'] == 2
+    assert threads == [threading.current_thread()] * 2
+
+
+def test_task_log_keeps_arguments_as_logged(tmp_path, executor):
+    task_logger, listener = executor._setup_task_logger(str(tmp_path), 'args')
+    listener.stop()  # hold records in the queue until the arguments changed
+    kwargs = {'model': 'before'}
+
+    task_logger.info("  Keyword arguments: %s", kwargs)
+    kwargs['model'] = 'after'
+    listener.start()
+    executor._stop_task_log(task_logger, listener)
+
+    with open(tmp_path / 'execution.log', encoding='utf-8') as f:
+        log = f.read()
+    assert "'model': 'before'" in log
+    assert "'model': 'after'" not in log
+
+
+def test_job_without_local_tasks_reports_zero_counts(executor):
+    tasks = [TaskDefinition(name='get_hostname', client='client-b', order=1)]
+
+    result = executor.execute_job_tasks(6, 'elsewhere', tasks)
+
+    assert result['success'] is True
+    assert (result['executed_count'], result['failed_count'], result['total_count']) == (0, 0, 0)